@@ -7,22 +7,27 @@ Note that resides in its own file mostly because it is imported in few
 places in Astacus; the other modules in the directory have
 dependencies on the actual cassandra driver, but this one does not.
 
-
-NOTE: While caching e.g. self.get_config result would be tempting (and
-even moreso get_port and get_hostnames), sadly pydantic and functools
-do not live together too well: see
+NOTE: The parsed configuration file is cached in a private attribute;
+pydantic and functools.lru_cache do not live together too well: see
 https://github.com/samuelcolvin/pydantic/issues/3376
 
-
 """
 
 from astacus.common.utils import AstacusModel
 from collections.abc import Sequence
 from pathlib import Path
-from pydantic import root_validator
+from pydantic import PrivateAttr, root_validator
 
 import yaml
 
+# Also used by the node to rewrite cassandra.yaml
+_SafeLoader: type[yaml.SafeLoader | yaml.CSafeLoader]
+_SafeDumper: type[yaml.SafeDumper | yaml.CSafeDumper]
+try:
+    _SafeLoader, _SafeDumper = yaml.CSafeLoader, yaml.CSafeDumper
+except AttributeError:  # pragma: no cover - libyaml not available
+    _SafeLoader, _SafeDumper = yaml.SafeLoader, yaml.SafeDumper
+
 SNAPSHOT_NAME = "astacus-backup"
 SNAPSHOT_GLOB = f"data/*/*/snapshots/{SNAPSHOT_NAME}"
 BACKUP_GLOB = "data/*/*/backups/"
@@ -43,6 +48,8 @@ class CassandraClientConfiguration(AstacusModel):
     # If set, configure ssl access configuration which requires the ca cert
     ca_cert_path: str | None = None
 
+    _config: dict | None = PrivateAttr(default=None)
+
     @classmethod
     @root_validator
     def config_or_hostname_port_provided(cls, values: dict) -> dict:
@@ -63,6 +70,8 @@ class CassandraClientConfiguration(AstacusModel):
         return self.get_config()["listen_address"]
 
     def get_config(self) -> dict:
-        assert self.config_path
-        with self.config_path.open() as f:
-            return yaml.safe_load(f)
+        if self._config is None:
+            assert self.config_path
+            with self.config_path.open() as f:
+                self._config = yaml.load(f, Loader=_SafeLoader)
+        return self._config
@@ -150,15 +150,19 @@ class OpMixin:
         return Op.StartResult(op_id=op.op_id, status_url=status_url)
 
     def get_op_and_op_info(self, *, op_id, op_name=None):
-        op_info = self.state.op_info
-        if op_id != op_info.op_id or (op_name and op_name != op_info.op_name):
-            logger.info("request for nonexistent %s.%s != %r", op_name, op_id, op_info)
-            raise HTTPException(
-                404,
-                {
-                    "code": magic.ErrorCode.operation_id_mismatch,
-                    "op": op_id,
-                    "message": "Unknown operation id",
-                },
-            )
-        return self.state.op, op_info
+        return get_op_and_op_info(state=self.state, op_id=op_id, op_name=op_name)
+
+
+def get_op_and_op_info(*, state: OpState, op_id, op_name=None):
+    op_info = state.op_info
+    if op_id != op_info.op_id or (op_name and op_name != op_info.op_name):
+        logger.info("request for nonexistent %s.%s != %r", op_name, op_id, op_info)
+        raise HTTPException(
+            404,
+            {
+                "code": magic.ErrorCode.operation_id_mismatch,
+                "op": op_id,
+                "message": "Unknown operation id",
+            },
+        )
+    return state.op, op_info
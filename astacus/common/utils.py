@@ -109,16 +109,22 @@ async def httpx_request(
     timeout: float = 10.0,
     json: bool = True,
     ignore_status_code: bool = False,
+    client: httpx.AsyncClient | None = None,
     **kw,
 ) -> httpx.Response | Mapping[str, Any] | None:
     """Wrapper for httpx.request which handles timeouts as non-exceptions,
     and returns only valid results that we actually care about.
+
+    If `client` is provided, the request goes through it (and its connection pool)
+    instead of a new client created for that request only.
     """
     r = None
     # TBD: may need to redact url in future, if we actually wind up
     # using passwords in urls here.
     logger.info("async-request %s %s by %s", method, url, caller)
-    async with httpx.AsyncClient() as client:
+    async with contextlib.AsyncExitStack() as stack:
+        if client is None:
+            client = await stack.enter_async_context(httpx.AsyncClient())
         try:
             r = await client.request(method, url, timeout=timeout, **kw)
             if not r.is_error:
@@ -134,7 +140,7 @@ async def httpx_request(
             logger.warning("Network error from %s to %s: %r", url, caller, ex)
         except httpx.HTTPError as ex:
             logger.warning("Unexpected response from %s to %s: %r", url, caller, ex)
-        return None
+    return None
 
 
 @contextlib.asynccontextmanager
@@ -229,6 +235,7 @@ def exponential_backoff(
     class _Iter:
         retry = -1
         initial = None
+        next_delay: float = 0
 
         @property
         def _delay(self):
@@ -237,10 +244,16 @@ def exponential_backoff(
             time_now = time.monotonic()
             if not self.retry:
                 self.initial = time_now
+                self.next_delay = initial
                 return 0
-            delay = initial * multiplier ** (self.retry - 1)
+            # The delay is updated incrementally and stops growing once
+            # capped, instead of computing ever-growing powers over a
+            # long polling duration
+            delay = self.next_delay
             if maximum is not None:
                 delay = min(delay, maximum)
+            if maximum is None or delay < maximum:
+                self.next_delay = delay * multiplier
             if duration is not None:
                 time_left_after_sleep = (self.initial + duration) - time_now - delay
                 if time_left_after_sleep < 0:
@@ -324,6 +337,12 @@ def size_as_short_str(size: int | float) -> str:
 
 
 def parallel_map_to(*, fun, iterable, result_callback, n=None) -> bool:
+    if n == 1:
+        # No need for a pool of threads to run one function call at a time
+        for map_in in iterable:
+            if not result_callback(map_in=map_in, map_out=fun(map_in)):
+                return False
+        return True
     iterable_as_list = list(iterable)
     with Pool(n) as p:
         for map_in, map_out in zip(iterable_as_list, p.imap(fun, iterable_as_list)):
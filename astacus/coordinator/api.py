@@ -7,22 +7,24 @@ from .cleanup import CleanupOp
 from .coordinator import BackupOp, Coordinator, DeltaBackupOp, RestoreOp
 from .list import CachedListEntries, list_backups, list_delta_backups
 from .lockops import LockOps
-from .state import CachedListResponse
+from .state import CachedListResponse, coordinator_state, CoordinatorState
 from astacus import config
 from astacus.common import ipc
 from astacus.common.magic import StrEnum
-from astacus.common.msgspec_glue import register_msgspec_glue, StructResponse
-from astacus.common.op import Op
+from astacus.common.msgspec_glue import register_msgspec_glue
+from astacus.common.op import get_op_and_op_info, Op
 from astacus.config import APP_HASH_KEY, get_config_content_and_hash
 from asyncio import to_thread
 from collections.abc import Sequence
-from fastapi import APIRouter, Body, Depends, HTTPException, Request
+from fastapi import APIRouter, Body, Depends, HTTPException, Request, Response
 from typing import Annotated
-from urllib.parse import urljoin
+from urllib.parse import urlunsplit
 
+import asyncio
 import logging
 import msgspec
 import os
+import posixpath
 import time
 
 register_msgspec_glue()
@@ -72,11 +74,16 @@ async def config_status(*, request: Request):
 @router.post("/lock")
 async def lock(*, locker: str, c: Coordinator = Depends(), op: LockOps = Depends()):
     result = c.start_op(op_name=OpName.lock, op=op, fun=op.lock)
-    return LockStartResult(unlock_url=urljoin(str(c.request_url), f"../unlock?locker={locker}"), **result.dict())
+    # Equivalent to urljoin(url, "../unlock?locker=..."), but reuses the
+    # already split (and cached) request url components
+    url = c.request_url
+    unlock_path = posixpath.join(posixpath.dirname(posixpath.dirname(url.path)), "unlock")
+    unlock_url = urlunsplit((url.scheme, url.netloc, unlock_path, f"locker={locker}", ""))
+    return LockStartResult(unlock_url=unlock_url, **result.dict())
 
 
 @router.post("/unlock")
-def unlock(*, locker: str, c: Coordinator = Depends(), op: LockOps = Depends()):
+async def unlock(*, locker: str, c: Coordinator = Depends(), op: LockOps = Depends()):
     return c.start_op(op_name=OpName.unlock, op=op, fun=op.unlock)
 
 
@@ -113,38 +120,58 @@ async def restore(
 
 
 @router.get("/list")
-async def _list_backups(
-    *, storage: Annotated[str, Body()] = "", c: Coordinator = Depends(), request: Request
-) -> StructResponse:
+async def _list_backups(*, storage: Annotated[str, Body()] = "", c: Coordinator = Depends(), request: Request) -> Response:
     req = ipc.ListRequest(storage=storage)
     coordinator_config = c.config
-    cached_list_response = c.state.cached_list_response
-    if cached_list_response is not None:
-        age = time.monotonic() - cached_list_response.timestamp
-        if (
-            age < c.config.list_ttl
-            and cached_list_response.coordinator_config == coordinator_config
-            and cached_list_response.list_request
-        ):
-            return StructResponse(cached_list_response.list_response)
-    if c.state.cached_list_running:
+    list_response_bytes = get_cached_list_response_bytes(c=c, req=req)
+    if list_response_bytes is not None:
+        return Response(content=list_response_bytes, media_type="application/json")
+    refresh_done = c.state.cached_list_refresh_done
+    if refresh_done is not None:
+        # Someone else is already producing the list; wait for it, and
+        # use the result if it was for the same request
+        await refresh_done.wait()
+        list_response_bytes = get_cached_list_response_bytes(c=c, req=req)
+        if list_response_bytes is not None:
+            return Response(content=list_response_bytes, media_type="application/json")
         raise HTTPException(status_code=429, detail="Already caching list result")
-    c.state.cached_list_running = True
+    refresh_done = c.state.cached_list_refresh_done = asyncio.Event()
     try:
+        cached_list_response = c.state.cached_list_response
         cache = (
-            get_cache_entries_from_list_response(cached_list_response.list_response)
+            get_cache_entries_from_list_response(
+                msgspec.json.decode(cached_list_response.list_response_bytes, type=ipc.ListResponse)
+            )
             if cached_list_response is not None
             else {}
         )
         list_response = await to_thread(list_backups, req=req, json_mstorage=c.json_mstorage, cache=cache)
+        list_response_bytes = msgspec.json.encode(list_response)
         c.state.cached_list_response = CachedListResponse(
             coordinator_config=coordinator_config,
             list_request=req,
-            list_response=list_response,
+            list_response_bytes=list_response_bytes,
         )
     finally:
-        c.state.cached_list_running = False
-    return StructResponse(list_response)
+        c.state.cached_list_refresh_done = None
+        refresh_done.set()
+    return Response(content=list_response_bytes, media_type="application/json")
+
+
+def get_cached_list_response_bytes(*, c: Coordinator, req: ipc.ListRequest) -> bytes | None:
+    cached_list_response = c.state.cached_list_response
+    if cached_list_response is None:
+        return None
+    age = time.monotonic() - cached_list_response.timestamp
+    # Configuration reload replaces the config object, so identity
+    # check is enough (and much cheaper than pydantic model equality)
+    if (
+        age < c.config.list_ttl
+        and cached_list_response.coordinator_config is c.config
+        and cached_list_response.list_request == req
+    ):
+        return cached_list_response.list_response_bytes
+    return None
 
 
 def get_cache_entries_from_list_response(list_response: ipc.ListResponse) -> CachedListEntries:
@@ -177,7 +204,7 @@ async def cleanup(
 
 @router.get("/{op_name}/{op_id}")
 @router.get("/delta/{op_name}/{op_id}")
-def op_status(*, op_name: OpName, op_id: int, c: Coordinator = Depends()):
+async def op_status(*, op_name: OpName, op_id: int, c: Coordinator = Depends()):
     op, op_info = c.get_op_and_op_info(op_id=op_id, op_name=op_name)
     result = {"state": op_info.op_status}
     if isinstance(op, (BackupOp, DeltaBackupOp, RestoreOp)):
@@ -187,8 +214,10 @@ def op_status(*, op_name: OpName, op_id: int, c: Coordinator = Depends()):
 
 @router.put("/{op_name}/{op_id}/sub-result")
 @router.put("/delta/{op_name}/{op_id}/sub-result")
-async def op_sub_result(*, op_name: OpName, op_id: int, c: Coordinator = Depends()):
-    op, _ = c.get_op_and_op_info(op_id=op_id, op_name=op_name)
+async def op_sub_result(*, op_name: OpName, op_id: int, state: CoordinatorState = Depends(coordinator_state)):
+    # This is called by every node whenever its progress changes, so
+    # only the coordinator state is looked up, not the whole Coordinator
+    op, _ = get_op_and_op_info(state=state, op_id=op_id, op_name=op_name)
     # We used to have results available here, but not use those
     # that was wasting a lot of memory by generating the same result twice.
     if not op.subresult_sleeper:
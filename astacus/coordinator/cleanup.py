@@ -35,7 +35,7 @@ class CleanupOp(SteppedCoordinatorOp):
                 keep_days=coalesce(req.retention.keep_days, c.config.retention.keep_days),
             )
         steps = c.get_plugin().get_cleanup_steps(context=context, retention=retention, explicit_delete=req.explicit_delete)
-        super().__init__(c=c, attempts=1, steps=steps)
+        super().__init__(c=c, attempts=1, steps=steps, operation_context=context)
 
 
 def coalesce(a: int | None, b: int | None) -> int | None:
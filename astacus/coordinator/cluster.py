@@ -15,7 +15,6 @@ from typing import Any, cast, TypeAlias, TypeVar
 import asyncio
 import copy
 import httpx
-import json
 import logging
 import msgspec
 import urllib.parse
@@ -44,6 +43,7 @@ class Cluster:
         stats: StatsClient | None = None,
     ):
         self.nodes = nodes
+        self._node_url_prefixes = [f"{node.url}/" for node in nodes]
         self.poll_config = PollConfig() if poll_config is None else poll_config
         self.subresult_url = subresult_url
         self.subresult_sleeper = subresult_sleeper
@@ -86,8 +86,10 @@ class Cluster:
         """
         if nodes is None:
             nodes = self.nodes
+            url_prefixes = self._node_url_prefixes
         else:
             nodes = list(nodes)
+            url_prefixes = [f"{node.url}/" for node in nodes]
 
         if not nodes:
             return []
@@ -98,7 +100,9 @@ class Cluster:
         else:
             if req is None:
                 req = ipc.NodeRequest()
-            reqs = [copy.deepcopy(req) for _ in nodes]
+            # Every node gets the same request, so copy and encode it just once
+            req = copy.deepcopy(req)
+            reqs = [req] * len(nodes)
         assert reqs
 
         if self.subresult_url:
@@ -106,12 +110,16 @@ class Cluster:
                 assert isinstance(subreq, ipc.NodeRequest)
                 subreq.result_url = self.subresult_url
 
-        urls = [f"{node.url}/{url}" for node in nodes]
+        urls = [url_prefix + url for url_prefix in url_prefixes]
         assert len(reqs) == len(urls)
 
         # Now 'reqs' + 'urls' contains all we need to actually perform
         # requests we want to.
-        aws = [utils.httpx_request(url, caller=caller, data=msgspec.json.encode(req), **kw) for req, url in zip(reqs, urls)]
+        if req is not None:
+            contents = [msgspec.json.encode(req)] * len(urls)
+        else:
+            contents = [msgspec.json.encode(subreq) for subreq in reqs]
+        aws = [utils.httpx_request(url, caller=caller, content=content, **kw) for content, url in zip(contents, urls)]
         results = await asyncio.gather(*aws, return_exceptions=True)
 
         logger.info("request_from_nodes %r to %r => %r", reqs, urls, results)
@@ -135,26 +143,33 @@ class Cluster:
             expected_result = {"locked": False}
         else:
             raise NotImplementedError(f"Unknown lock call: {call!r}")
-        rv = LockResult.ok
-        for node, result in zip(nodes, results):
+        # Handle exceptions and responses separately, as it makes the
+        # result precedence (any failure > any exception > ok) explicit
+        exceptions = [(node, result) for node, result in zip(nodes, results) if not isinstance(result, httpx.Response)]
+        responses = [(node, result) for node, result in zip(nodes, results) if isinstance(result, httpx.Response)]
+        for node, result in exceptions:
             # This assert helps mypy handle request_from_nodes return type dependent on its json parameter
             assert not isinstance(result, Mapping)
-            if result is None or isinstance(result, BaseException):
-                logger.info("Exception occurred when talking with node %r: %r", node, result)
-                if rv != LockResult.failure:
-                    # failures mean that we're done, so don't override them
-                    rv = LockResult.exception
-            elif result.is_error:
-                logger.info("%s of %s failed - unexpected result %r %r", call, node, result.status_code, result)
-                rv = LockResult.failure
-            else:
-                try:
-                    decoded_result = result.json()
-                except json.JSONDecodeError:
-                    decoded_result = None
-                if decoded_result != expected_result:
-                    logger.info("%s of %s failed - unexpected result %r", call, node, decoded_result)
-                    rv = LockResult.failure
+            logger.info("Exception occurred when talking with node %r: %r", node, result)
+        failed = False
+        for node, response in responses:
+            if response.is_error:
+                logger.info("%s of %s failed - unexpected result %r %r", call, node, response.status_code, response)
+                failed = True
+                continue
+            try:
+                decoded_result = msgspec.json.decode(response.content)
+            except msgspec.DecodeError:
+                decoded_result = None
+            if decoded_result != expected_result:
+                logger.info("%s of %s failed - unexpected result %r", call, node, decoded_result)
+                failed = True
+        if failed:
+            rv = LockResult.failure
+        elif exceptions:
+            rv = LockResult.exception
+        else:
+            rv = LockResult.ok
         if rv == LockResult.failure and self.stats is not None:
             self.stats.increase(
                 "astacus_lock_call_failure",
@@ -184,7 +199,10 @@ class Cluster:
         # Note that we don't have timeout mechanism here as such,
         # however, if re-locking times out, we will bail out. TBD if
         # we need timeout mechanism here anyway.
-        failures = {i: 0 for i in range(len(results))}
+        failures = [0] * len(results)
+        decoder = msgspec.json.Decoder(result_class)
+        # Indexes of nodes whose result is not yet final
+        pending = list(range(len(urls)))
 
         async for _ in utils.exponential_backoff(
             initial=self.poll_config.delay_start,
@@ -193,33 +211,31 @@ class Cluster:
             duration=self.poll_config.duration,
             async_sleeper=self.subresult_sleeper,
         ):
-            for i, (url, result) in enumerate(zip(urls, results)):
-                # TBD: This could be done in parallel too
-                if result is not None and result.progress.final:
+            polled = await asyncio.gather(
+                *(
+                    self._poll_node_result(url=urls[i], i=i, n=len(urls), decoder=decoder, previous=results[i])
+                    for i in pending
+                )
+            )
+            still_pending = []
+            for i, result in zip(pending, polled):
+                if result is None:
+                    failures[i] += 1
+                    if failures[i] >= self.poll_config.maximum_failures:
+                        raise WaitResultError("too many failures")
+                    still_pending.append(i)
                     continue
-                progress_text = f"{result.progress!r}" if result is not None else "not started"
-                logger.info("%s node #%d/%d: %s", node_op_from_url(url), i, len(urls), progress_text)
-                async with httpx_request_stream(
-                    url, caller="Nodes.wait_successful_results", timeout=self.poll_config.result_timeout
-                ) as r:
-                    if r is None:
-                        failures[i] += 1
-                        if failures[i] >= self.poll_config.maximum_failures:
-                            raise WaitResultError("too many failures")
-                        continue
-                    # We got something -> decode the result
-                    assert isinstance(r, httpx.Response)
-                    payload = bytearray()
-                    async for chunk in r.aiter_bytes():
-                        payload.extend(chunk)
-                result = msgspec.json.decode(payload, type=result_class)
                 results[i] = result
                 failures[i] = 0
-                if self.progress_handler is not None:
-                    self.progress_handler(Progress.merge(r.progress for r in results if r is not None))
-                if result.progress.finished_failed:
-                    raise WaitResultError
-            if not any(True for result in results if result is None or not result.progress.final):
+                if not result.progress.final:
+                    still_pending.append(i)
+            pending = still_pending
+            # Progress only changes when some node answered; merge it then once per tick
+            if self.progress_handler is not None and any(result is not None for result in polled):
+                self.progress_handler(Progress.merge(r.progress for r in results if r is not None))
+            if any(result.progress.finished_failed for result in polled if result is not None):
+                raise WaitResultError
+            if not pending:
                 break
         else:
             logger.info("wait_successful_results timed out")
@@ -227,6 +243,23 @@ class Cluster:
         # The case is valid because we get there when all results are not None
         return cast(Sequence[NR], results)
 
+    async def _poll_node_result(
+        self, *, url: str, i: int, n: int, decoder: msgspec.json.Decoder[NR], previous: NR | None
+    ) -> NR | None:
+        progress_text = f"{previous.progress!r}" if previous is not None else "not started"
+        logger.info("%s node #%d/%d: %s", node_op_from_url(url), i, n, progress_text)
+        async with httpx_request_stream(
+            url, caller="Nodes.wait_successful_results", timeout=self.poll_config.result_timeout
+        ) as r:
+            if r is None:
+                return None
+            # We got something -> decode the result
+            assert isinstance(r, httpx.Response)
+            payload = bytearray()
+            async for chunk in r.aiter_bytes():
+                payload.extend(chunk)
+        return decoder.decode(payload)
+
 
 class WaitResultError(Exception):
     pass
@@ -18,7 +18,7 @@ from astacus.coordinator.config import coordinator_config, CoordinatorConfig, Co
 from astacus.coordinator.plugins import get_plugin
 from astacus.coordinator.state import coordinator_state, CoordinatorState
 from collections.abc import Awaitable, Callable, Iterator, Sequence
-from fastapi import BackgroundTasks, Depends, HTTPException
+from fastapi import BackgroundTasks, Depends, HTTPException, Request
 from functools import cached_property
 from starlette.datastructures import URL
 from typing import Any
@@ -34,16 +34,45 @@ import time
 logger = logging.getLogger(__name__)
 
 
-def coordinator_stats(config: CoordinatorConfig = Depends(coordinator_config)) -> StatsClient:
-    return StatsClient(config=config.statsd)
+def _get_or_create_config_dependency(
+    *, request: Request, key: str, config: CoordinatorConfig, factory: Callable[[], Any]
+) -> Any:
+    """Get or create app-wide object derived from the (current) coordinator config
 
+    The objects are stateless with respect to requests, so there is no
+    need to recreate them for each request; configuration reload
+    replaces the config object, which invalidates the cached value.
+    """
+    cached = getattr(request.app.state, key, None)
+    if cached is None or cached[0] is not config:
+        cached = (config, factory())
+        setattr(request.app.state, key, cached)
+    return cached[1]
 
-def coordinator_hexdigest_mstorage(config: CoordinatorConfig = Depends(coordinator_config)) -> MultiStorage:
+
+async def coordinator_stats(request: Request, config: CoordinatorConfig = Depends(coordinator_config)) -> StatsClient:
+    return _get_or_create_config_dependency(
+        request=request, key="coordinator_stats", config=config, factory=lambda: StatsClient(config=config.statsd)
+    )
+
+
+def _create_hexdigest_mstorage(config: CoordinatorConfig) -> MultiStorage:
     assert config.object_storage
     return MultiRohmuStorage(config=config.object_storage)
 
 
-def coordinator_json_mstorage(config: CoordinatorConfig = Depends(coordinator_config)) -> MultiStorage:
+async def coordinator_hexdigest_mstorage(
+    request: Request, config: CoordinatorConfig = Depends(coordinator_config)
+) -> MultiStorage:
+    return _get_or_create_config_dependency(
+        request=request,
+        key="coordinator_hexdigest_mstorage",
+        config=config,
+        factory=lambda: _create_hexdigest_mstorage(config),
+    )
+
+
+def _create_json_mstorage(config: CoordinatorConfig) -> MultiStorage:
     assert config.object_storage
     mstorage = MultiRohmuStorage(config=config.object_storage)
     if config.object_storage_cache:
@@ -52,6 +81,14 @@ def coordinator_json_mstorage(config: CoordinatorConfig = Depends(coordinator_co
     return mstorage
 
 
+async def coordinator_json_mstorage(
+    request: Request, config: CoordinatorConfig = Depends(coordinator_config)
+) -> MultiStorage:
+    return _get_or_create_config_dependency(
+        request=request, key="coordinator_json_mstorage", config=config, factory=lambda: _create_json_mstorage(config)
+    )
+
+
 class Coordinator(op.OpMixin):
     state: CoordinatorState
     """ Convenience dependency which contains sub-dependencies most API endpoints need """
@@ -260,18 +297,31 @@ class SteppedCoordinatorOp(LockedCoordinatorOp):
     steps: Sequence[Step[Any]]
     step_progress: dict[int, Progress]
 
-    def __init__(self, *, c: Coordinator = Depends(), attempts: int, steps: Sequence[Step[Any]]):
+    def __init__(
+        self,
+        *,
+        c: Coordinator = Depends(),
+        attempts: int,
+        steps: Sequence[Step[Any]],
+        operation_context: OperationContext | None = None,
+    ):
         super().__init__(c=c)
         self.state = c.state
         self.attempts = attempts
         self.steps = steps
         self.step_progress = {}
+        # Resources registered by the plugin while building the steps are released once the operation ends
+        self.exit_stack = operation_context.exit_stack if operation_context is not None else contextlib.AsyncExitStack()
 
     @property
     def progress(self) -> Progress:
         return Progress.merge(self.step_progress.values())
 
     async def run_with_lock(self, cluster: Cluster) -> None:
+        async with self.exit_stack:
+            await self.run_attempts(cluster)
+
+    async def run_attempts(self, cluster: Cluster) -> None:
         name = self.__class__.__name__
         try:
             for attempt in range(1, self.attempts + 1):
@@ -326,7 +376,7 @@ class BackupOp(SteppedCoordinatorOp):
     def __init__(self, *, c: Coordinator) -> None:
         context = c.get_operation_context()
         steps = c.get_plugin().get_backup_steps(context=context)
-        super().__init__(c=c, attempts=c.config.backup_attempts, steps=steps)
+        super().__init__(c=c, attempts=c.config.backup_attempts, steps=steps, operation_context=context)
 
 
 class DeltaBackupOp(SteppedCoordinatorOp):
@@ -337,7 +387,7 @@ class DeltaBackupOp(SteppedCoordinatorOp):
     def __init__(self, *, c: Coordinator) -> None:
         context = c.get_operation_context()
         steps = c.get_plugin().get_delta_backup_steps(context=context)
-        super().__init__(c=c, attempts=c.config.backup_attempts, steps=steps)
+        super().__init__(c=c, attempts=c.config.backup_attempts, steps=steps, operation_context=context)
 
 
 class RestoreOp(SteppedCoordinatorOp):
@@ -352,4 +402,4 @@ class RestoreOp(SteppedCoordinatorOp):
             step_names = [step.__class__.__name__ for step in steps]
             step_index = step_names.index(req.stop_after_step)
             steps = steps[: step_index + 1]
-        super().__init__(c=c, attempts=1, steps=steps)  # c.config.restore_attempts
+        super().__init__(c=c, attempts=1, steps=steps, operation_context=context)  # c.config.restore_attempts
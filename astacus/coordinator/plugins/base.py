@@ -12,15 +12,18 @@ from astacus.common.asyncstorage import AsyncHexDigestStorage, AsyncJsonStorage
 from astacus.common.ipc import Retention
 from astacus.common.snapshot import SnapshotGroup
 from astacus.common.utils import AstacusModel
-from astacus.coordinator.cluster import Cluster, Result
+from astacus.coordinator.cluster import Cluster
 from astacus.coordinator.config import CoordinatorNode
 from astacus.coordinator.manifest import download_backup_manifest, download_backup_min_manifest
-from collections import Counter
+from collections import Counter, defaultdict
 from collections.abc import Sequence, Set
 from typing import Any, Counter as TCounter, Generic, TypeVar
 
+import asyncio
+import contextlib
 import dataclasses
 import datetime
+import heapq
 import httpx
 import logging
 import msgspec
@@ -64,6 +67,8 @@ class OperationContext:
     storage_name: str
     json_storage: AsyncJsonStorage
     hexdigest_storage: AsyncHexDigestStorage
+    # Resources used by the steps of the operation, released when the operation ends
+    exit_stack: contextlib.AsyncExitStack = dataclasses.field(default_factory=contextlib.AsyncExitStack)
 
 
 class Step(Generic[StepResult_co]):
@@ -91,6 +96,28 @@ class StepsContext:
         self.step_results[step_class] = result
 
 
+@dataclasses.dataclass
+class ParallelStep(Step[None]):
+    """
+    Run independent steps concurrently, then store the result of each step in the context.
+
+    The steps must not depend on the result of each other. If one of the steps fails,
+    the other ones are cancelled before the failure is raised.
+    """
+
+    steps: Sequence[Step[Any]]
+
+    async def run_step(self, cluster: Cluster, context: StepsContext) -> None:
+        try:
+            async with asyncio.TaskGroup() as task_group:
+                tasks = [task_group.create_task(step.run_step(cluster, context)) for step in self.steps]
+        except BaseExceptionGroup as group:
+            # Raise the failure like a single step would, the caller handles specific exception types
+            raise group.exceptions[0]
+        for step, task in zip(self.steps, tasks):
+            context.set_result(step.__class__, task.result())
+
+
 @dataclasses.dataclass
 class SnapshotStep(Step[Sequence[ipc.SnapshotResult]]):
     """
@@ -118,12 +145,19 @@ class SnapshotStep(Step[Sequence[ipc.SnapshotResult]]):
 class ListHexdigestsStep(Step[Set[str]]):
     """
     Fetch the list of all files already present in object storage, identified by their hexdigest.
+
+    The listing is kept for the following attempts of the same operation: the cluster lock
+    prevents cleanups from deleting files meanwhile, so the storage can only have gained
+    files since, which at worst makes a retry upload some of them again.
     """
 
     hexdigest_storage: AsyncHexDigestStorage
+    _hexdigests: Set[str] | None = dataclasses.field(default=None, init=False, repr=False)
 
     async def run_step(self, cluster: Cluster, context: StepsContext) -> Set[str]:
-        return set(await self.hexdigest_storage.list_hexdigests())
+        if self._hexdigests is None:
+            self._hexdigests = set(await self.hexdigest_storage.list_hexdigests())
+        return self._hexdigests
 
 
 @dataclasses.dataclass
@@ -263,7 +297,10 @@ class BackupNameStep(Step[str]):
 
     async def run_step(self, cluster: Cluster, context: StepsContext) -> str:
         if not self.requested_name:
-            return sorted(await self.json_storage.list_jsons())[-1]
+            backup_names = await self.json_storage.list_jsons()
+            if not backup_names:
+                raise StepFailedError("no backup available to restore")
+            return max(backup_names)
         if self.requested_name.startswith(magic.JSON_BACKUP_PREFIX):
             return self.requested_name
         return f"{magic.JSON_BACKUP_PREFIX}{self.requested_name}"
@@ -334,32 +371,44 @@ class RestoreStep(Step[Sequence[ipc.NodeResult]]):
                 f"No snapshot results, yet full restore desired; {node_to_backup_index!r} {cluster.nodes!r}"
             )
 
-        start_results: list[Result | None] = []
+        download_nodes: list[CoordinatorNode] = []
+        download_requests: list[ipc.NodeRequest] = []
+        clear_nodes: list[CoordinatorNode] = []
         for node, backup_index in zip(cluster.nodes, node_to_backup_index):
             if backup_index is not None:
                 # Restore whatever was backed up
                 snapshot_result = snapshot_results[backup_index]
                 assert snapshot_result.state is not None
-                node_request: ipc.NodeRequest = ipc.SnapshotDownloadRequest(
-                    storage=self.storage_name,
-                    backup_name=backup_name,
-                    snapshot_index=backup_index,
-                    root_globs=snapshot_result.state.root_globs,
+                download_nodes.append(node)
+                download_requests.append(
+                    ipc.SnapshotDownloadRequest(
+                        storage=self.storage_name,
+                        backup_name=backup_name,
+                        snapshot_index=backup_index,
+                        root_globs=snapshot_result.state.root_globs,
+                    )
                 )
-                op = "download"
             elif self.partial_restore_nodes:
                 # If partial restore, do not clear other nodes
                 continue
             else:
-                assert snapshot_results[0].state is not None
-                node_request = ipc.SnapshotClearRequest(root_globs=snapshot_results[0].state.root_globs)
-                op = "clear"
-            start_result = await cluster.request_from_nodes(
-                op, caller="RestoreSnapshotStep", method="post", req=node_request, nodes=[node]
-            )
-            if len(start_result) != 1:
-                return []
-            start_results.extend(start_result)
+                clear_nodes.append(node)
+        clear_request = None
+        if clear_nodes:
+            assert snapshot_results[0].state is not None
+            clear_request = ipc.SnapshotClearRequest(root_globs=snapshot_results[0].state.root_globs)
+        # One request_from_nodes call per operation, and both of them concurrently
+        download_start_results, clear_start_results = await asyncio.gather(
+            cluster.request_from_nodes(
+                "download", caller="RestoreSnapshotStep", method="post", reqs=download_requests, nodes=download_nodes
+            ),
+            cluster.request_from_nodes(
+                "clear", caller="RestoreSnapshotStep", method="post", req=clear_request, nodes=clear_nodes
+            ),
+        )
+        if len(download_start_results) != len(download_nodes) or len(clear_start_results) != len(clear_nodes):
+            return []
+        start_results = [*download_start_results, *clear_start_results]
         return await cluster.wait_successful_results(start_results=start_results, result_class=ipc.NodeResult)
 
 
@@ -708,16 +757,13 @@ def get_node_to_backup_index_from_partial_restore_nodes(
     nodes: Sequence[CoordinatorNode],
 ) -> Sequence[int | None]:
     node_to_backup_index: list[int | None] = [None] * len(nodes)
-    hostname_to_backup_index: dict[str | None, int] = {}
-    url_to_node_index: dict[str | None, int] = {}
-    for i, node in enumerate(nodes):
-        url_to_node_index[node.url] = i
-    for i, res in enumerate(snapshot_results):
-        hostname_to_backup_index[res.hostname] = i
+    num_nodes = len(nodes)
+    num_backup_nodes = len(snapshot_results)
+    hostname_to_backup_index: dict[str | None, int] = {res.hostname: i for i, res in enumerate(snapshot_results)}
+    url_to_node_index: dict[str | None, int] = {node.url: i for i, node in enumerate(nodes)}
     for req_node in partial_restore_nodes:
         node_index = req_node.node_index
         if node_index is not None:
-            num_nodes = len(nodes)
             if node_index < 0 or node_index >= num_nodes:
                 raise exceptions.NotFoundException(
                     f"Invalid node_index in partial restore: Must be 0 <= {node_index} < {num_nodes}"
@@ -730,7 +776,6 @@ def get_node_to_backup_index_from_partial_restore_nodes(
                 )
         backup_index = req_node.backup_index
         if backup_index is not None:
-            num_backup_nodes = len(snapshot_results)
             if backup_index < 0 or backup_index >= num_backup_nodes:
                 raise exceptions.NotFoundException(
                     f"Invalid backup_index in partial restore: Must be 0 <= {backup_index} < {num_backup_nodes}"
@@ -753,6 +798,12 @@ def get_node_to_backup_index_from_azs(
     azs_in_nodes: TCounter[str],
 ) -> Sequence[int | None]:
     node_to_backup_index: list[int | None] = [None] * len(nodes)
+    backup_indices_by_az: defaultdict[str, list[int]] = defaultdict(list)
+    for backup_index, snapshot_result in enumerate(snapshot_results):
+        backup_indices_by_az[snapshot_result.az].append(backup_index)
+    node_indices_by_az: defaultdict[str, list[int]] = defaultdict(list)
+    for node_index, node in enumerate(nodes):
+        node_indices_by_az[node.az].append(node_index)
     # This is strictly speaking just best-effort assignment
     for (backup_az, backup_n), (node_az, node_n) in zip(azs_in_backup.most_common(), azs_in_nodes.most_common()):
         if backup_n > node_n:
@@ -761,14 +812,9 @@ def get_node_to_backup_index_from_azs(
                 f"AZ {node_az}, to be restored from {backup_az}, is missing {missing_n} nodes"
             )
 
-        for backup_index, snapshot_result in enumerate(snapshot_results):
-            if snapshot_result.az != backup_az:
-                continue
-            for node_index, node in enumerate(nodes):
-                if node.az != node_az or node_to_backup_index[node_index] is not None:
-                    continue
-                node_to_backup_index[node_index] = backup_index
-                break
+        # Each AZ appears only once in most_common(), so none of these nodes has been assigned yet
+        for backup_index, node_index in zip(backup_indices_by_az[backup_az], node_indices_by_az[node_az]):
+            node_to_backup_index[node_index] = backup_index
     return node_to_backup_index
 
 
@@ -777,10 +823,6 @@ class NodeIndexData(msgspec.Struct, kw_only=True):
     sshashes: list[ipc.SnapshotHash] = msgspec.field(default_factory=list)
     total_size: int = 0
 
-    def append_sshash(self, sshash: ipc.SnapshotHash) -> None:
-        self.total_size += sshash.size
-        self.sshashes.append(sshash)
-
 
 def build_node_index_datas(
     *, hexdigests: Set[str], snapshots: Sequence[ipc.SnapshotResult], node_indices: Sequence[int]
@@ -791,7 +833,10 @@ def build_node_index_datas(
         for snapshot_hash in snapshot_result.hashes or []:
             sshash_to_node_indexes.setdefault(snapshot_hash, []).append(i)
 
-    node_index_datas = [NodeIndexData(node_index=node_index) for node_index in node_indices]
+    # Upload size and hashes per node are kept in flat lists while assigning,
+    # the NodeIndexData structs are only built once at the end
+    loads = [0] * len(node_indices)
+    buckets: list[list[ipc.SnapshotHash]] = [[] for _ in node_indices]
 
     # This is not really optimal algorithm, but probably good enough.
 
@@ -801,13 +846,30 @@ def build_node_index_datas(
         (sshash, indexes) = item
         return len(indexes), -sshash.size
 
-    todo = sorted(sshash_to_node_indexes.items(), key=_sshash_to_node_indexes_key)
+    # Files already in storage are dropped before sorting, they are usually the vast majority
+    todo = [item for item in sshash_to_node_indexes.items() if item[0].hexdigest not in hexdigests]
+    todo.sort(key=_sshash_to_node_indexes_key)
+    # Files present on every node pick the least loaded node from a heap of (load, node)
+    # instead of scanning all nodes. Loads only grow, so entries whose load is not the
+    # current one are outdated and skipped when popped.
+    all_node_indexes = list(range(len(node_indices)))
+    loads_heap = [(0, i) for i in all_node_indexes]
     for snapshot_hash, node_indexes in todo:
-        if snapshot_hash.hexdigest in hexdigests:
-            continue
-        _, node_index = min((node_index_datas[node_index].total_size, node_index) for node_index in node_indexes)
-        node_index_datas[node_index].append_sshash(snapshot_hash)
-    return [data for data in node_index_datas if data.sshashes]
+        if node_indexes == all_node_indexes:
+            while loads_heap[0][0] != loads[loads_heap[0][1]]:
+                heapq.heappop(loads_heap)
+            node_index = loads_heap[0][1]
+        else:
+            # node_indexes is in ascending order, so ties go to the lowest index
+            node_index = min(node_indexes, key=loads.__getitem__)
+        loads[node_index] += snapshot_hash.size
+        heapq.heappush(loads_heap, (loads[node_index], node_index))
+        buckets[node_index].append(snapshot_hash)
+    return [
+        NodeIndexData(node_index=node_index, sshashes=bucket, total_size=load)
+        for node_index, bucket, load in zip(node_indices, buckets, loads)
+        if bucket
+    ]
 
 
 async def upload_node_index_datas(
@@ -818,8 +880,8 @@ async def upload_node_index_datas(
     upload_request: str,
 ):
     logger.info("upload_node_index_datas")
-    start_results: list[Result | None] = []
     nodes_metadata = await get_nodes_metadata(cluster)
+    reqs: list[ipc.NodeRequest] = []
     for data in node_index_datas:
         if ipc.NodeFeatures.validate_file_hashes.value in nodes_metadata[data.node_index].features:
             req: ipc.NodeRequest = ipc.SnapshotUploadRequestV20221129(
@@ -827,12 +889,16 @@ async def upload_node_index_datas(
             )
         else:
             req = ipc.SnapshotUploadRequest(hashes=data.sshashes, storage=storage_name)
-        start_result = await cluster.request_from_nodes(
-            upload_request, caller="upload_node_index_datas", method="post", req=req, nodes=[cluster.nodes[data.node_index]]
-        )
-        if len(start_result) != 1:
-            raise StepFailedError("upload failed")
-        start_results.extend(start_result)
+        reqs.append(req)
+    start_results = await cluster.request_from_nodes(
+        upload_request,
+        caller="upload_node_index_datas",
+        method="post",
+        reqs=reqs,
+        nodes=[cluster.nodes[data.node_index] for data in node_index_datas],
+    )
+    if len(start_results) != len(node_index_datas):
+        raise StepFailedError("upload failed")
     return await cluster.wait_successful_results(start_results=start_results, result_class=ipc.SnapshotUploadResult)
 
 
@@ -8,7 +8,10 @@ from collections.abc import Mapping, Sequence
 from re import Match
 
 import copy
+import functools
+import httpx
 import logging
+import msgspec
 import re
 import urllib.parse
 
@@ -58,12 +61,14 @@ class HttpClickHouseClient(ClickHouseClient):
         username: str | None = None,
         password: str | None = None,
         timeout: float = 10.0,
+        http_client: httpx.AsyncClient | None = None,
     ):
         self.host = host
         self.port = port
         self.username = username
         self.password = password
         self.timeout = timeout
+        self.http_client = http_client
 
     async def execute(self, query: bytes, timeout: float | None = None, session_id: str | None = None) -> Sequence[Row]:
         assert isinstance(query, bytes)
@@ -88,6 +93,7 @@ class HttpClickHouseClient(ClickHouseClient):
             headers=headers,
             timeout=self.timeout if timeout is None else timeout,
             ignore_status_code=True,
+            client=self.http_client,
         )
         assert not isinstance(response, Mapping)
         if response is None:
@@ -103,7 +109,7 @@ class HttpClickHouseClient(ClickHouseClient):
             )
         if response.content:
             # Beware: large ints (Int64, UInt64, and larger) will be returned as strings
-            decoded_response = response.json()
+            decoded_response = msgspec.json.decode(response.content)
             return decoded_response["data"]
         return []
 
@@ -143,6 +149,7 @@ STRING_ESCAPE_MAP = {
 }
 
 
+@functools.lru_cache(maxsize=4096)
 def escape_sql_identifier(identifier: bytes) -> str:
     r"""Escape a byte string into an sql identifier usable in a ClickHouse query.
 
@@ -8,9 +8,11 @@ from astacus.common.utils import AstacusModel, build_netloc
 from astacus.coordinator.plugins.zookeeper import KazooZooKeeperClient, ZooKeeperClient
 from astacus.coordinator.plugins.zookeeper_config import ZooKeeperConfiguration
 from collections.abc import Sequence
+from contextlib import AsyncExitStack
 from pathlib import Path
 
 import enum
+import httpx
 
 
 class ClickHouseNode(AstacusModel):
@@ -59,13 +61,25 @@ def get_zookeeper_client(configuration: ZooKeeperConfiguration) -> ZooKeeperClie
     return KazooZooKeeperClient(hosts=[build_netloc(node.host, node.port) for node in configuration.nodes], user=user)
 
 
-def get_clickhouse_clients(configuration: ClickHouseConfiguration) -> Sequence[ClickHouseClient]:
+def get_clickhouse_clients(
+    configuration: ClickHouseConfiguration, *, exit_stack: AsyncExitStack, max_concurrent_queries_per_node: int
+) -> Sequence[ClickHouseClient]:
+    # All clients share the same connection pool to keep connections alive between queries.
+    # Waiting for a free connection counts against the timeout of each query, so the pool has
+    # room for every query that can run at once: nodes x per-node concurrency.
+    # The pool is closed by the exit stack when the operation ends.
+    max_connections = max(1, len(configuration.nodes) * max_concurrent_queries_per_node)
+    http_client = httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+    )
+    exit_stack.push_async_callback(http_client.aclose)
     return [
         HttpClickHouseClient(
             host=node.host,
             port=node.port,
             username=configuration.username,
             password=configuration.password,
+            http_client=http_client,
         )
         for node in configuration.nodes
     ]
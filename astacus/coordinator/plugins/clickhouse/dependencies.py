@@ -32,8 +32,8 @@ def sort_topologically(
             sorter.add(element_key, dependency)
         for dependency in get_dependants(element):
             sorter.add(dependency, element_key)
-    sort_order = list(sorter.static_order())
-    return sorted(nodes, key=lambda element: sort_order.index(get_key(element)))
+    sort_positions = {key: position for position, key in enumerate(sorter.static_order())}
+    return sorted(nodes, key=lambda element: sort_positions[get_key(element)])
 
 
 def tables_sorted_by_dependencies(tables: Sequence[Table]) -> Sequence[Table]:
@@ -2,15 +2,18 @@
 Copyright (c) 2021 Aiven Ltd
 See LICENSE for details
 """
+import functools
 import re
 
 
+@functools.lru_cache(maxsize=4096)
 def escape_for_file_name(name: bytes) -> str:
     # This is based on ClickHouse's escapeForFileName which is used internally to
     # safely create both file and folders on disk and ZooKeeper node names.
     return re.sub(rb"[^a-zA-Z0-9_]", _percent_encode_byte, name).decode()
 
 
+@functools.lru_cache(maxsize=4096)
 def unescape_from_file_name(encoded_name: str) -> bytes:
     encoded_bytes = encoded_name.encode()
     return re.sub(rb"%([0-9A-F][0-9A-F])", _percent_decode_byte, encoded_bytes)
@@ -67,9 +67,16 @@ def list_parts_to_attach(
     Returns a list of table identifiers and part names to attach from the snapshot.
     """
     parts_to_attach: set[tuple[str, bytes]] = set()
+    # All files of a part share the same directory, there is no need to parse each of them
+    parsed_directories: set[str] = set()
     assert snapshot_result.state is not None
     for snapshot_file in snapshot_result.state.files:
+        directory = snapshot_file.relative_path.rpartition("/")[0]
+        if directory in parsed_directories:
+            continue
         parsed_path = disks.parse_part_file_path(snapshot_file.relative_path)
+        if parsed_path.file_parts:
+            parsed_directories.add(directory)
         table = tables_by_uuid.get(parsed_path.table_uuid)
         if table is not None:
             parts_to_attach.add((table.escaped_sql_identifier, parsed_path.part_name))
@@ -19,6 +19,7 @@ from .steps import (
     FreezeTablesStep,
     GetVersionsStep,
     ListDatabaseReplicasStep,
+    MAX_CONCURRENT_DATABASE_QUERIES,
     MoveFrozenPartsStep,
     PrepareClickHouseManifestStep,
     RemoveFrozenTablesStep,
@@ -46,6 +47,7 @@ from astacus.coordinator.plugins.base import (
     ListHexdigestsStep,
     MapNodesStep,
     OperationContext,
+    ParallelStep,
     RestoreStep,
     SnapshotStep,
     Step,
@@ -84,7 +86,11 @@ class ClickHousePlugin(CoordinatorPlugin):
     max_concurrent_restore_replica: int = 10
     max_concurrent_restore_replica_per_node: int = 10
     freeze_timeout: float = 3600.0
+    # Number of tables frozen at the same time on each server, raise it to freeze tables in parallel
+    max_concurrent_freeze_per_node: int = 1
     unfreeze_timeout: float = 3600.0
+    # Number of tables unfrozen at the same time on each server, raise it to unfreeze tables in parallel
+    max_concurrent_unfreeze_per_node: int = 1
     # Deprecated parameter, ignored
     attach_timeout: float = 300.0
     # Deprecated parameter, ignored
@@ -98,7 +104,16 @@ class ClickHousePlugin(CoordinatorPlugin):
 
     def get_backup_steps(self, *, context: OperationContext) -> Sequence[Step[Any]]:
         zookeeper_client = get_zookeeper_client(self.zookeeper)
-        clickhouse_clients = get_clickhouse_clients(self.clickhouse)
+        clickhouse_clients = get_clickhouse_clients(
+            self.clickhouse,
+            exit_stack=context.exit_stack,
+            # Listing the databases runs alongside the macros query on the first server
+            max_concurrent_queries_per_node=max(
+                self.max_concurrent_freeze_per_node,
+                self.max_concurrent_unfreeze_per_node,
+                MAX_CONCURRENT_DATABASE_QUERIES + 1,
+            ),
+        )
         disks = Disks.from_disk_configs(self.disks)
         return [
             ValidateConfigStep(clickhouse=self.clickhouse),
@@ -110,15 +125,22 @@ class ClickHousePlugin(CoordinatorPlugin):
                 unfreeze_timeout=self.unfreeze_timeout,
             ),
             # Collect the users, database and tables
-            RetrieveAccessEntitiesStep(
-                zookeeper_client=zookeeper_client,
-                access_entities_path=self.replicated_access_zookeeper_path,
+            ParallelStep(
+                steps=[
+                    RetrieveAccessEntitiesStep(
+                        zookeeper_client=zookeeper_client,
+                        access_entities_path=self.replicated_access_zookeeper_path,
+                    ),
+                    RetrieveDatabasesAndTablesStep(clients=clickhouse_clients),
+                    RetrieveMacrosStep(clients=clickhouse_clients),
+                ]
             ),
-            RetrieveDatabasesAndTablesStep(clients=clickhouse_clients),
-            RetrieveMacrosStep(clients=clickhouse_clients),
             # Then freeze all tables
             FreezeTablesStep(
-                clients=clickhouse_clients, freeze_name=self.freeze_name, freeze_unfreeze_timeout=self.freeze_timeout
+                clients=clickhouse_clients,
+                freeze_name=self.freeze_name,
+                freeze_unfreeze_timeout=self.freeze_timeout,
+                max_concurrent_freeze_unfreeze_per_node=self.max_concurrent_freeze_per_node,
             ),
             # Then snapshot and backup all frozen table parts
             SnapshotStep(
@@ -128,7 +150,10 @@ class ClickHousePlugin(CoordinatorPlugin):
             UploadBlocksStep(storage_name=context.storage_name, validate_file_hashes=False),
             # Cleanup frozen parts
             UnfreezeTablesStep(
-                clients=clickhouse_clients, freeze_name=self.freeze_name, freeze_unfreeze_timeout=self.unfreeze_timeout
+                clients=clickhouse_clients,
+                freeze_name=self.freeze_name,
+                freeze_unfreeze_timeout=self.unfreeze_timeout,
+                max_concurrent_freeze_unfreeze_per_node=self.max_concurrent_unfreeze_per_node,
             ),
             # Prepare the manifest for restore
             CollectObjectStorageFilesStep(disks=disks),
@@ -154,7 +179,18 @@ class ClickHousePlugin(CoordinatorPlugin):
             #  - test it before enabling it
             raise NotImplementedError
         zookeeper_client = get_zookeeper_client(self.zookeeper)
-        clients = get_clickhouse_clients(self.clickhouse)
+        clients = get_clickhouse_clients(
+            self.clickhouse,
+            exit_stack=context.exit_stack,
+            max_concurrent_queries_per_node=max(
+                self.max_concurrent_drop_databases_per_node,
+                self.max_concurrent_create_databases_per_node,
+                self.max_concurrent_attach_per_node,
+                self.max_concurrent_sync_per_node,
+                self.max_concurrent_restart_replica_per_node,
+                self.max_concurrent_restore_replica_per_node,
+            ),
+        )
         disks = Disks.from_disk_configs(self.disks)
         source_disks = Disks.from_disk_configs(self.disks, storage_name=context.storage_name)
         return [
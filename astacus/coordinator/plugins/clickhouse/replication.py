@@ -10,11 +10,29 @@ from astacus.coordinator.plugins.base import StepFailedError
 from astacus.coordinator.plugins.zookeeper import ZooKeeperConnection
 from collections.abc import Mapping, Sequence
 from kazoo.client import EventType, WatchedEvent
+from typing import Final
 
 import asyncio
 import dataclasses
 import re
 
+CREATE_REPLICATED_DATABASE_RE: Final = re.compile(
+    chain_of(
+        b"CREATE DATABASE",
+        one_of(TokenType.RawIdentifier, TokenType.QuotedIdentifier),
+        b"ENGINE",
+        TokenType.Equal,
+        b"Replicated",
+        TokenType.OpenParenthesis,
+        named_group("zookeeper_path", TokenType.String),
+        TokenType.Comma,
+        named_group("shard", TokenType.String),
+        TokenType.Comma,
+        named_group("replica", TokenType.String),
+        TokenType.CloseParenthesis,
+    )
+)
+
 
 @dataclasses.dataclass(frozen=True)
 class DatabaseReplica:
@@ -85,23 +103,7 @@ async def get_shard_and_replica(clickhouse_client: ClickHouseClient, database_na
     db_rows = await clickhouse_client.execute(f"SHOW CREATE DATABASE {escaped_database_name}".encode())
     assert isinstance(db_rows[0][0], str)
     create_database_query = db_rows[0][0].encode()
-    matched = re.match(
-        chain_of(
-            b"CREATE DATABASE",
-            one_of(TokenType.RawIdentifier, TokenType.QuotedIdentifier),
-            b"ENGINE",
-            TokenType.Equal,
-            b"Replicated",
-            TokenType.OpenParenthesis,
-            named_group("zookeeper_path", TokenType.String),
-            TokenType.Comma,
-            named_group("shard", TokenType.String),
-            TokenType.Comma,
-            named_group("replica", TokenType.String),
-            TokenType.CloseParenthesis,
-        ),
-        create_database_query,
-    )
+    matched = CREATE_REPLICATED_DATABASE_RE.match(create_database_query)
     if not matched:
         raise StepFailedError(f"Could not parse CREATE DATABASE query for {database_name!r}")
     return unescape_sql_string(matched.group("shard")), unescape_sql_string(matched.group("replica"))
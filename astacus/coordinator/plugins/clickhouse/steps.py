@@ -36,7 +36,7 @@ from astacus.coordinator.plugins.base import (
     StepFailedError,
     StepsContext,
 )
-from astacus.coordinator.plugins.zookeeper import ChangeWatch, TransactionError, ZooKeeperClient
+from astacus.coordinator.plugins.zookeeper import ChangeWatch, TransactionError, ZooKeeperClient, ZooKeeperConnection
 from base64 import b64decode
 from collections.abc import Awaitable, Callable, Iterable, Iterator, Mapping, Sequence
 from typing import Any, cast, TypeVar
@@ -78,6 +78,8 @@ WHERE
 ORDER BY (system.tables.database,system.tables.name)
 SETTINGS show_table_uuid_in_table_create_query_if_not_nil=true
 """
+# Number of SHOW CREATE DATABASE queries sent in parallel to the server while listing databases
+MAX_CONCURRENT_DATABASE_QUERIES = 4
 _T = TypeVar("_T")
 
 
@@ -122,27 +124,47 @@ class RetrieveAccessEntitiesStep(Step[Sequence[AccessEntity]]):
     access_entities_path: str
 
     async def run_step(self, cluster: Cluster, context: StepsContext) -> Sequence[AccessEntity]:
-        access_entities = []
         async with self.zookeeper_client.connect() as connection:
             change_watch = ChangeWatch()
-            entity_types = await connection.get_children(self.access_entities_path, watch=change_watch)
-            for entity_type in entity_types:
-                if entity_type != "uuid":
-                    entity_type_path = f"{self.access_entities_path}/{entity_type}"
-                    node_names = await connection.get_children(entity_type_path, watch=change_watch)
-                    for node_name in node_names:
-                        uuid_bytes = await connection.get(f"{entity_type_path}/{node_name}", watch=change_watch)
-                        entity_uuid = uuid.UUID(uuid_bytes.decode())
-                        entity_path = f"{self.access_entities_path}/uuid/{entity_uuid}"
-                        attach_query_bytes = await connection.get(entity_path, watch=change_watch)
-                        access_entities.append(
-                            AccessEntity(
-                                type=entity_type,
-                                uuid=entity_uuid,
-                                name=unescape_from_file_name(node_name),
-                                attach_query=attach_query_bytes,
-                            )
-                        )
+            entity_types = [
+                entity_type
+                for entity_type in await connection.get_children(self.access_entities_path, watch=change_watch)
+                if entity_type != "uuid"
+            ]
+            # Each level of the hierarchy is fetched with concurrent requests instead of one node at a time
+            entity_types_node_names = await asyncio.gather(
+                *(
+                    connection.get_children(f"{self.access_entities_path}/{entity_type}", watch=change_watch)
+                    for entity_type in entity_types
+                )
+            )
+            entity_types_and_names = [
+                (entity_type, node_name)
+                for entity_type, node_names in zip(entity_types, entity_types_node_names)
+                for node_name in node_names
+            ]
+            uuids_bytes = await connection.get_many(
+                [
+                    f"{self.access_entities_path}/{entity_type}/{node_name}"
+                    for entity_type, node_name in entity_types_and_names
+                ],
+                watch=change_watch,
+            )
+            entity_uuids = [uuid.UUID(uuid_bytes.decode()) for uuid_bytes in uuids_bytes]
+            attach_queries_bytes = await connection.get_many(
+                [f"{self.access_entities_path}/uuid/{entity_uuid}" for entity_uuid in entity_uuids], watch=change_watch
+            )
+            access_entities = [
+                AccessEntity(
+                    type=entity_type,
+                    uuid=entity_uuid,
+                    name=unescape_from_file_name(node_name),
+                    attach_query=attach_query_bytes,
+                )
+                for (entity_type, node_name), entity_uuid, attach_query_bytes in zip(
+                    entity_types_and_names, entity_uuids, attach_queries_bytes
+                )
+            ]
             if change_watch.has_changed:
                 # With care, we could instead look at what exactly changed and just update the minimum
                 raise TransientException("Concurrent modification during access entities retrieval")
@@ -168,21 +190,23 @@ class RetrieveDatabasesAndTablesStep(Step[DatabasesAndTables]):
         clickhouse_client = self.clients[0]
         # We fetch databases and tables in a single query, we don't have to care about consistency within that step.
         # However, the schema could be modified between now and the freeze step.
-        databases: dict[bytes, ReplicatedDatabase] = {}
         tables: list[Table] = []
         database_rows = await clickhouse_client.execute(DATABASES_LIST_QUERY)
+        db_names_and_uuids: list[tuple[bytes, uuid.UUID]] = []
         for base64_db_name, db_uuid_str in database_rows:
             assert isinstance(base64_db_name, str)
             assert isinstance(db_uuid_str, str)
-            db_uuid = uuid.UUID(db_uuid_str)
-            db_name = b64decode(base64_db_name)
+            db_names_and_uuids.append((b64decode(base64_db_name), uuid.UUID(db_uuid_str)))
+        databases: dict[bytes, ReplicatedDatabase] = {}
+
+        async def retrieve_database(db_name: bytes, db_uuid: uuid.UUID) -> None:
             shard, replica = await get_shard_and_replica(clickhouse_client, db_name)
-            databases[db_name] = ReplicatedDatabase(
-                name=db_name,
-                uuid=db_uuid,
-                shard=shard,
-                replica=replica,
-            )
+            databases[db_name] = ReplicatedDatabase(name=db_name, uuid=db_uuid, shard=shard, replica=replica)
+
+        await gather_limited(
+            MAX_CONCURRENT_DATABASE_QUERIES,
+            [retrieve_database(db_name, db_uuid) for db_name, db_uuid in db_names_and_uuids],
+        )
         table_rows = await clickhouse_client.execute(TABLES_LIST_QUERY)
         for (
             base64_db_name,
@@ -305,6 +329,7 @@ class FreezeUnfreezeTablesStepBase(Step[None]):
     clients: Sequence[ClickHouseClient]
     freeze_name: str
     freeze_unfreeze_timeout: float
+    max_concurrent_freeze_unfreeze_per_node: int = 1
 
     @property
     def operation(self) -> str:
@@ -315,6 +340,7 @@ class FreezeUnfreezeTablesStepBase(Step[None]):
         _, tables = context.get_result(RetrieveDatabasesAndTablesStep)
         versions = context.get_result(GetVersionsStep)
         to_freeze = [table for table in tables if table.requires_freezing]
+        escaped_freeze_name = escape_sql_string(self.freeze_name.encode())
 
         def freeze_partitions(clickhouse_client: ClickHouseClient) -> Iterable[Awaitable[None]]:
             for table in to_freeze:
@@ -323,7 +349,7 @@ class FreezeUnfreezeTablesStepBase(Step[None]):
                     self.freeze_unfreeze_timeout,
                     (
                         f"ALTER TABLE {table.escaped_sql_identifier} "
-                        f"{self.operation} WITH NAME {escape_sql_string(self.freeze_name.encode())}"
+                        f"{self.operation} WITH NAME {escaped_freeze_name}"
                         f" SETTINGS distributed_ddl_task_timeout={self.freeze_unfreeze_timeout}"
                     ).encode(),
                 )
@@ -331,7 +357,7 @@ class FreezeUnfreezeTablesStepBase(Step[None]):
         await run_partition_cmd_on_every_node(
             clients=self.clients,
             fn=freeze_partitions,
-            per_node_concurrency_limit=1,
+            per_node_concurrency_limit=self.max_concurrent_freeze_unfreeze_per_node,
             versions=versions,
         )
 
@@ -341,8 +367,9 @@ class FreezeTablesStep(FreezeUnfreezeTablesStepBase):
     """
     Creates a frozen copy of the tables that won't change while we are uploading parts of it.
 
-    Each table is frozen separately, one after the other. This means the complete backup of all
-    tables will not represent a single, globally consistent, point in time.
+    Each table is frozen separately, up to `max_concurrent_freeze_unfreeze_per_node` tables at
+    a time on each node. This means the complete backup of all tables will not represent a single,
+    globally consistent, point in time.
 
     The frozen copy is done using hardlink and does not cost extra disk space (ClickHouse can
     use hardlinks because parts files never change after they are created).
@@ -404,14 +431,23 @@ class MoveFrozenPartsStep(Step[None]):
         # I do not like mutating an existing result, we should making this more visible
         # by returning a mutated copy and use that in other steps
         snapshot_results: Sequence[ipc.SnapshotResult] = context.get_result(SnapshotStep)
+        # All files of a part share the same directory, only parse and rename each directory once
+        renamed_directories: dict[str, str] = {}
         for snapshot_result in snapshot_results:
             assert snapshot_result.state is not None
             for snapshot_file in snapshot_result.state.files:
+                directory, _, file_name = snapshot_file.relative_path.rpartition("/")
+                renamed_directory = renamed_directories.get(directory)
+                if renamed_directory is not None:
+                    snapshot_file.relative_path = f"{renamed_directory}/{file_name}"
+                    continue
+                parsed_path = self.disks.parse_part_file_path(snapshot_file.relative_path)
                 snapshot_file.relative_path = msgspec.structs.replace(
-                    self.disks.parse_part_file_path(snapshot_file.relative_path),
-                    freeze_name=None,
-                    detached=False,
+                    parsed_path, freeze_name=None, detached=False
                 ).to_path()
+                # Only reuse directories that are strictly inside a part
+                if parsed_path.file_parts:
+                    renamed_directories[directory] = snapshot_file.relative_path[: -len(file_name) - 1]
 
 
 @dataclasses.dataclass
@@ -597,32 +633,51 @@ class RestoreAccessEntitiesStep(Step[None]):
 
     zookeeper_client: ZooKeeperClient
     access_entities_path: str
+    max_entities_per_transaction: int = 32
 
     async def run_step(self, cluster: Cluster, context: StepsContext) -> None:
         clickhouse_manifest = context.get_result(ClickHouseManifestStep)
+        access_entities = access_entities_sorted_by_dependencies(clickhouse_manifest.access_entities)
+        entity_uuids_path = f"{self.access_entities_path}/uuid"
         async with self.zookeeper_client.connect() as connection:
-            for access_entity in access_entities_sorted_by_dependencies(clickhouse_manifest.access_entities):
-                escaped_entity_name = escape_for_file_name(access_entity.name)
-                entity_type_path = f"{self.access_entities_path}/{access_entity.type}"
-                entity_uuids_path = f"{self.access_entities_path}/uuid"
-                await connection.try_create(entity_type_path, b"")
+            # The parent znodes are shared by many entities, create each of them only once
+            if access_entities:
                 await connection.try_create(entity_uuids_path, b"")
-                entity_name_path = f"{entity_type_path}/{escaped_entity_name}"
-                entity_path = f"{entity_uuids_path}/{access_entity.uuid}"
-                attach_query_bytes = access_entity.attach_query
-                transaction = connection.transaction()
-                transaction.create(entity_name_path, str(access_entity.uuid).encode())
-                transaction.create(entity_path, attach_query_bytes)
+            entity_types = dict.fromkeys(access_entity.type for access_entity in access_entities)
+            await asyncio.gather(
+                *(connection.try_create(f"{self.access_entities_path}/{entity_type}", b"") for entity_type in entity_types)
+            )
+            # The entities themselves are created in dependency order, several of them per transaction.
+            # A transaction is atomic, the dependencies of an entity are created with or before it.
+            for start in range(0, len(access_entities), self.max_entities_per_transaction):
+                chunk = access_entities[start : start + self.max_entities_per_transaction]
                 try:
-                    await transaction.commit()
+                    await self._create_access_entities(connection, chunk)
                 except TransactionError:
-                    # The only errors we can have inside the transaction are NodeExistsError.
-                    # It's most likely because we're resuming a failed restore.
-                    # There are odd cases where the cause and end result could be surprising:
-                    # if a different entity already exists with the same name and different id,
-                    # but we're not supposed to restore into a completely different
-                    # ZooKeeper storage.
-                    pass
+                    # Some of these entities already exist, probably because we're resuming a failed restore:
+                    # the whole transaction was rolled back, create the entities one by one instead.
+                    for access_entity in chunk:
+                        try:
+                            await self._create_access_entities(connection, [access_entity])
+                        except TransactionError:
+                            # The only errors we can have inside the transaction are NodeExistsError.
+                            # There are odd cases where the cause and end result could be surprising:
+                            # if a different entity already exists with the same name and different id,
+                            # but we're not supposed to restore into a completely different
+                            # ZooKeeper storage.
+                            pass
+
+    async def _create_access_entities(
+        self, connection: ZooKeeperConnection, access_entities: Sequence[AccessEntity]
+    ) -> None:
+        transaction = connection.transaction()
+        for access_entity in access_entities:
+            escaped_entity_name = escape_for_file_name(access_entity.name)
+            entity_name_path = f"{self.access_entities_path}/{access_entity.type}/{escaped_entity_name}"
+            entity_path = f"{self.access_entities_path}/uuid/{access_entity.uuid}"
+            transaction.create(entity_name_path, str(access_entity.uuid).encode())
+            transaction.create(entity_path, access_entity.attach_query)
+        await transaction.commit()
 
 
 @dataclasses.dataclass
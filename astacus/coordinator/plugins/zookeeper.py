@@ -41,7 +41,8 @@ class ZooKeeperConnection:
 
     This is a context manager, the connection is opened when entering the context manager and closed when leaving it.
 
-    A `ZooKeeperConnection` cannot be shared between multiple threads or multiple asyncio coroutines.
+    A `ZooKeeperConnection` cannot be shared between multiple threads, requests can however be
+    sent concurrently by multiple asyncio coroutines running in the same event loop.
     """
 
     async def __aenter__(self) -> "ZooKeeperConnection":
@@ -58,6 +59,14 @@ class ZooKeeperConnection:
         """
         raise NotImplementedError
 
+    async def get_many(self, paths: Sequence[str], watch: Watcher | None = None) -> Sequence[bytes]:
+        """
+        Returns the values of the nodes with the specified `paths`, in the same order.
+
+        Raises `NoNodeError` if any of the nodes does not exist.
+        """
+        raise NotImplementedError
+
     async def get_children(self, path: str, watch: Watcher | None = None) -> Sequence[str]:
         """
         Returns the sorted list of all children of the given `path`.
@@ -243,6 +252,21 @@ class KazooZooKeeperConnection(ZooKeeperConnection):
         except kazoo.exceptions.NoNodeError as e:
             raise NoNodeError(path) from e
 
+    async def get_many(self, paths: Sequence[str], watch: Watcher | None = None) -> Sequence[bytes]:
+        return await to_thread(self.client.retry, self._get_many, paths, watch=watch)
+
+    def _get_many(self, paths: Sequence[str], watch: Watcher | None) -> Sequence[bytes]:
+        # Send all the requests before waiting for the first response
+        async_results = [self.client.get_async(path, watch=watch) for path in paths]
+        values = []
+        for path, async_result in zip(paths, async_results):
+            try:
+                data, _ = async_result.get()
+            except kazoo.exceptions.NoNodeError as e:
+                raise NoNodeError(path) from e
+            values.append(data)
+        return values
+
     async def get_children(self, path: str, watch: Watcher | None = None) -> Sequence[str]:
         try:
             return sorted(await to_thread(self.client.retry, self.client.get_children, path, watch=watch))
@@ -371,6 +395,9 @@ class FakeZooKeeperConnection(ZooKeeperConnection):
                 self.watches.setdefault(parts, []).append(watch)
             return storage[parts]
 
+    async def get_many(self, paths: Sequence[str], watch: Watcher | None = None) -> Sequence[bytes]:
+        return [await self.get(path, watch=watch) for path in paths]
+
     async def get_children(self, path: str, watch: Watcher | None = None) -> Sequence[str]:
         # Since we have the "create" command, the watch can be triggered on the parent
         assert self in self.client.connections
@@ -15,6 +15,7 @@ from astacus.coordinator.config import CoordinatorConfig
 from dataclasses import dataclass
 from fastapi import FastAPI, Request
 
+import asyncio
 import msgspec
 import time
 
@@ -25,7 +26,9 @@ class CachedListResponse(msgspec.Struct, kw_only=True):
     timestamp: float = msgspec.field(default_factory=time.monotonic)
     coordinator_config: CoordinatorConfig
     list_request: ipc.ListRequest
-    list_response: ipc.ListResponse
+    # Stored already serialized; it is both smaller than the decoded
+    # structure and can be returned as-is on cache hits
+    list_response_bytes: bytes
 
 
 @dataclass
@@ -39,7 +42,9 @@ class CoordinatorState(OpState):
     """
 
     cached_list_response: CachedListResponse | None = None
-    cached_list_running: bool = False
+    # Set while the list response is being (re)computed; concurrent
+    # list requests wait for it instead of starting another listing
+    cached_list_refresh_done: asyncio.Event | None = None
     shutting_down: bool = False
 
 
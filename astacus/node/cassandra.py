@@ -10,14 +10,15 @@ Cassandra handling that is run on every node in the Cluster
 from .node import NodeOp
 from astacus.common import ipc
 from astacus.common.cassandra.client import CassandraClient
-from astacus.common.cassandra.config import SNAPSHOT_GLOB, SNAPSHOT_NAME
+from astacus.common.cassandra.config import _SafeDumper, _SafeLoader, SNAPSHOT_GLOB, SNAPSHOT_NAME
 from astacus.common.exceptions import TransientException
-from collections.abc import Callable
+from collections.abc import Callable, Mapping, Sequence
 from pathlib import Path
 from pydantic import DirectoryPath
 
 import contextlib
 import logging
+import os
 import shutil
 import subprocess
 import tempfile
@@ -38,6 +39,17 @@ def ks_table_from_backup_path(p: Path) -> tuple[str, str]:
     return p.parts[-3], p.parts[-2]
 
 
+def list_table_paths_by_name(keyspace_path: Path) -> Mapping[str, Sequence[Path]]:
+    # /.../keyspace/table-id, table names can't contain dashes
+    table_paths_by_name: dict[str, list[Path]] = {}
+    if keyspace_path.is_dir():
+        for table_path in keyspace_path.iterdir():
+            table_name, separator, _ = table_path.name.partition("-")
+            if separator:
+                table_paths_by_name.setdefault(table_name, []).append(table_path)
+    return table_paths_by_name
+
+
 class SimpleCassandraSubOp(NodeOp[ipc.NodeRequest, ipc.NodeResult]):
     """
     Generic class to handle no arguments in + no output out case subops.
@@ -141,36 +153,49 @@ class CassandraRestoreSSTablesOp(NodeOp[ipc.CassandraRestoreSSTablesRequest, ipc
         progress = self.result.progress
         table_snapshots = list(self.config.root.glob(self.req.table_glob))
         progress.add_total(len(table_snapshots))
+        data_path = self.config.root / "data"
+        keyspaces_to_skip = set(self.req.keyspaces_to_skip)
+        table_paths_by_keyspace: dict[str, Mapping[str, Sequence[Path]]] = {}
 
         for table_snapshot in table_snapshots:
             # expected table_snapshot structure: <config.root>/data/ks/tname-tid/...
-            keyspace_name, table_name_and_id = table_snapshot.relative_to(self.config.root / "data").parts[:2]
-            if keyspace_name in self.req.keyspaces_to_skip:
+            keyspace_name, table_name_and_id = table_snapshot.relative_to(data_path).parts[:2]
+            if keyspace_name in keyspaces_to_skip:
                 progress.add_success()
                 continue
 
             table_path = (
-                self.config.root / "data" / keyspace_name / table_name_and_id
+                data_path / keyspace_name / table_name_and_id
                 if self.req.match_tables_by == ipc.CassandraTableMatching.cfid
-                else self._match_table_by_name(keyspace_name, table_name_and_id)
+                else self._match_table_by_name(keyspace_name, table_name_and_id, table_paths_by_keyspace)
             )
 
             if self.req.expect_empty_target:
                 self._ensure_target_is_empty(keyspace_name=keyspace_name, table_path=table_path)
 
-            for file_path in table_snapshot.glob("*"):
-                file_path.rename(table_path / file_path.name)
+            # List the entries before moving them, renaming while iterating a directory is not portable
+            with os.scandir(table_snapshot) as scandir_it:
+                entries = list(scandir_it)
+            for entry in entries:
+                os.rename(entry.path, os.path.join(table_path, entry.name))
 
             progress.add_success()
 
         self.result.progress.done()
 
-    def _match_table_by_name(self, keyspace_name: str, table_name_and_id: str) -> DirectoryPath:
+    def _match_table_by_name(
+        self,
+        keyspace_name: str,
+        table_name_and_id: str,
+        table_paths_by_keyspace: dict[str, Mapping[str, Sequence[Path]]],
+    ) -> DirectoryPath:
         table_name, _ = table_name_and_id.rsplit("-", 1)
 
-        # This could be more efficient too; oh well.
         keyspace_path = self.config.root / "data" / keyspace_name
-        table_paths = list(keyspace_path.glob(f"{table_name}-*"))
+        # List each keyspace once instead of once per table, restoring does not add tables to the keyspace
+        if keyspace_name not in table_paths_by_keyspace:
+            table_paths_by_keyspace[keyspace_name] = list_table_paths_by_name(keyspace_path)
+        table_paths = list(table_paths_by_keyspace[keyspace_name].get(table_name, []))
         if not table_paths:
             raise RuntimeError(f"NO tables with prefix {table_name}- found in {keyspace_path}!")
         if len(table_paths) > 1:
@@ -210,7 +235,7 @@ class CassandraStartOp(NodeOp[ipc.CassandraStartRequest, ipc.NodeResult]):
         assert config_path
 
         with config_path.open() as config_read_fh:
-            config = yaml.safe_load(config_read_fh)
+            config = yaml.load(config_read_fh, Loader=_SafeLoader)
         progress.add_success()
 
         config["auto_bootstrap"] = self.req.replace_address_first_boot is not None
@@ -222,7 +247,7 @@ class CassandraStartOp(NodeOp[ipc.CassandraStartRequest, ipc.NodeResult]):
         if self.req.skip_bootstrap_streaming:
             config["skip_bootstrap_streaming"] = True
         with tempfile.NamedTemporaryFile(mode="w") as config_fh:
-            yaml.safe_dump(config, config_fh)
+            yaml.dump(config, config_fh, Dumper=_SafeDumper)
             config_fh.flush()
             progress.add_success()
 
@@ -40,10 +40,11 @@ class Downloader(ThreadLocalStorage):
         self.snapshot = snapshotter.snapshot
         self.parallel = parallel
         self.copy_dst_owner = copy_dst_owner
+        # Relative paths of the files of the snapshot state that already exist in dst with the right content
+        self.existing_relative_paths: set[str] = set()
 
     def _snapshotfile_already_exists(self, snapshotfile: ipc.SnapshotFile) -> bool:
-        existing_snapshotfile = self.snapshot.get_file(snapshotfile.relative_path)
-        return existing_snapshotfile is not None and existing_snapshotfile.equals_excluding_mtime(snapshotfile)
+        return snapshotfile.relative_path in self.existing_relative_paths
 
     def _download_snapshotfile(self, snapshotfile: ipc.SnapshotFile) -> None:
         if self._snapshotfile_already_exists(snapshotfile):
@@ -51,7 +52,6 @@ class Downloader(ThreadLocalStorage):
 
         relative_path = snapshotfile.relative_path
         download_path = self.dst / relative_path
-        download_path.parent.mkdir(parents=True, exist_ok=True)
         with utils.open_path_with_atomic_rename(download_path) as f:
             if snapshotfile.hexdigest:
                 self.local_storage.download_hexdigest_to_file(snapshotfile.hexdigest, f)
@@ -75,7 +75,6 @@ class Downloader(ThreadLocalStorage):
 
         src_path = self.dst / snapshotfile_src.relative_path
         dst_path = self.dst / snapshotfile.relative_path
-        dst_path.parent.mkdir(parents=True, exist_ok=True)
         shutil.copy(src_path, dst_path)
         os.utime(dst_path, ns=(snapshotfile.mtime_ns, snapshotfile.mtime_ns))
 
@@ -87,19 +86,40 @@ class Downloader(ThreadLocalStorage):
         still_running_callback: Callable[[], bool] = lambda: True,
     ) -> None:
         hexdigest_to_snapshotfiles: dict[str, list[ipc.SnapshotFile]] = {}
-        valid_relative_path_set = set()
+        relative_path_to_snapshotfile: dict[str, ipc.SnapshotFile] = {}
+        embedded_snapshotfiles: list[ipc.SnapshotFile] = []
+        total_size = 0
         for snapshotfile in snapshotstate.files:
-            valid_relative_path_set.add(snapshotfile.relative_path)
+            relative_path_to_snapshotfile[snapshotfile.relative_path] = snapshotfile
+            total_size += 1 + snapshotfile.file_size
             if snapshotfile.hexdigest:
                 hexdigest_to_snapshotfiles.setdefault(snapshotfile.hexdigest, []).append(snapshotfile)
+            else:
+                embedded_snapshotfiles.append(snapshotfile)
 
         self.snapshotter.perform_snapshot(progress=Progress())
+        # A single pass over the local snapshot is much cheaper than looking up each file
+        # of the snapshot state, one query at a time, from the download threads.
+        self.existing_relative_paths = set()
+        for existing_snapshotfile in self.snapshot.get_all_files():
+            snapshotfile_to_download = relative_path_to_snapshotfile.get(existing_snapshotfile.relative_path)
+            if snapshotfile_to_download is not None and existing_snapshotfile.equals_excluding_mtime(
+                snapshotfile_to_download
+            ):
+                self.existing_relative_paths.add(existing_snapshotfile.relative_path)
+        # Many files share the same directory, create each of them once instead of once per file
+        relative_dirs = {
+            os.path.dirname(relative_path)
+            for relative_path in relative_path_to_snapshotfile
+            if relative_path not in self.existing_relative_paths
+        }
+        for relative_dir in sorted(relative_dirs):
+            (self.dst / relative_dir).mkdir(parents=True, exist_ok=True)
         # TBD: Error checking, what to do if we're told to restore to existing directory?
-        progress.start(sum(1 + snapshotfile.file_size for snapshotfile in snapshotstate.files))
-        for snapshotfile in snapshotstate.files:
-            if not snapshotfile.hexdigest:
-                self._download_snapshotfile(snapshotfile)
-                progress.download_success(snapshotfile.file_size + 1)
+        progress.start(total_size)
+        for snapshotfile in embedded_snapshotfiles:
+            self._download_snapshotfile(snapshotfile)
+            progress.download_success(snapshotfile.file_size + 1)
         all_snapshotfiles = hexdigest_to_snapshotfiles.values()
 
         def _cb(*, map_in: Sequence[ipc.SnapshotFile], map_out: Sequence[ipc.SnapshotFile]) -> bool:
@@ -120,7 +140,7 @@ class Downloader(ThreadLocalStorage):
             return
 
         # Delete files that were not supposed to exist
-        for relative_path in set(self.snapshot.get_all_paths()).difference(valid_relative_path_set):
+        for relative_path in set(self.snapshot.get_all_paths()).difference(relative_path_to_snapshotfile):
             absolute_path = self.dst / relative_path
             absolute_path.unlink(missing_ok=True)
 
@@ -54,6 +54,13 @@ async def test_kazoo_zookeeper_client_get_missing_node_fails(zookeeper_client: K
             assert await connection.get("/does/not/exist")
 
 
+async def test_kazoo_zookeeper_client_get_many(zookeeper_client: KazooZooKeeperClient, znode: ZNode):
+    async with zookeeper_client.connect() as connection:
+        assert await connection.get_many([znode.path, znode.path]) == [znode.content, znode.content]
+        with pytest.raises(NoNodeError):
+            await connection.get_many([znode.path, "/does/not/exist"])
+
+
 async def test_kazoo_zookeeper_client_get_children(zookeeper_client: KazooZooKeeperClient) -> None:
     async with zookeeper_client.connect() as connection:
         assert await connection.get_children("/zookeeper") == ["config", "quota"]
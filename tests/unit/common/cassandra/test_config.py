@@ -0,0 +1,18 @@
+"""
+Copyright (c) 2026 Aiven Ltd
+See LICENSE for details
+"""
+
+from astacus.common.cassandra.config import CassandraClientConfiguration
+from pathlib import Path
+
+
+def test_cassandra_client_configuration_caches_config(tmp_path: Path) -> None:
+    config_path = tmp_path / "cassandra.yaml"
+    config_path.write_text("listen_address: 127.0.0.2\nnative_transport_port: 9042\n")
+    config = CassandraClientConfiguration(config_path=config_path, username="dummy", password="")
+    assert config.get_port() == 9042
+    # Subsequent calls must not hit the file again
+    config_path.unlink()
+    assert config.get_listen_address() == "127.0.0.2"
+    assert config.get_port() == 9042
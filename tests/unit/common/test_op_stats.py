@@ -14,10 +14,11 @@ from astacus.common.storage import MultiStorage
 from astacus.coordinator.cluster import Cluster
 from astacus.coordinator.config import CoordinatorConfig
 from astacus.coordinator.coordinator import Coordinator, SteppedCoordinatorOp
-from astacus.coordinator.plugins.base import Step, StepsContext
+from astacus.coordinator.plugins.base import OperationContext, Step, StepsContext
 from astacus.coordinator.state import CoordinatorState
 from fastapi import BackgroundTasks
 from starlette.datastructures import URL
+from unittest import mock
 from unittest.mock import patch
 
 
@@ -67,6 +68,27 @@ async def test_op_stats() -> None:
     assert mock_stats_timing.call_count == 3
 
 
+async def test_operation_context_is_closed_when_operation_ends() -> None:
+    stats = StatsClient(config=None)
+    coordinator = Coordinator(
+        request_url=URL(),
+        background_tasks=BackgroundTasks(),
+        config=CoordinatorConfig(plugin=Plugin.files),
+        state=CoordinatorState(),
+        stats=stats,
+        hexdigest_mstorage=MultiStorage(),
+        json_mstorage=MultiStorage(),
+    )
+    operation_context = OperationContext(storage_name="", json_storage=mock.Mock(), hexdigest_storage=mock.Mock())
+    close = mock.AsyncMock()
+    operation_context.exit_stack.push_async_callback(close)
+    operation = SteppedCoordinatorOp(c=coordinator, attempts=1, steps=[DummyStep1()], operation_context=operation_context)
+    operation.op_id = operation.info.op_id
+    operation.stats = stats
+    await operation.run_with_lock(Cluster(nodes=[]))
+    close.assert_awaited_once_with()
+
+
 class DummyOp(op.Op):
     pass
 
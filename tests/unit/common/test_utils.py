@@ -98,6 +98,9 @@ async def test_exponential_backoff(mocker: MockerFixture) -> None:
     # 1+2+4+8 = 15; +16 = 31 => not within 30s
     _assert_rounded_waits_equals([1, 2, 4, 8])
 
+    list(utils.exponential_backoff(initial=1, maximum=5, retries=5))
+    _assert_rounded_waits_equals([1, 2, 4, 5, 5])
+
     # Ensure the async version works too
     retries = []
     async for retry in utils.exponential_backoff(initial=1, retries=5):
@@ -149,6 +152,30 @@ def test_sizelimitedfile() -> None:
         assert lf.read() == b"bar"
 
 
+@pytest.mark.parametrize("n", [1, 3])
+def test_parallel_map_to(n: int) -> None:
+    results: list[tuple[int, int]] = []
+
+    def _result_callback(*, map_in: int, map_out: int) -> bool:
+        results.append((map_in, map_out))
+        return True
+
+    assert utils.parallel_map_to(fun=lambda x: x * 2, iterable=range(5), result_callback=_result_callback, n=n)
+    assert results == [(0, 0), (1, 2), (2, 4), (3, 6), (4, 8)]
+
+
+@pytest.mark.parametrize("n", [1, 3])
+def test_parallel_map_to_stops_when_callback_fails(n: int) -> None:
+    results: list[int] = []
+
+    def _result_callback(*, map_in: int, map_out: int) -> bool:
+        results.append(map_in)
+        return map_in < 2
+
+    assert not utils.parallel_map_to(fun=lambda x: x, iterable=range(5), result_callback=_result_callback, n=n)
+    assert results == [0, 1, 2]
+
+
 def test_open_path_with_atomic_rename(tmpdir: py.path.local) -> None:
     # default is bytes
     f1_path = f"{tmpdir}/f1"
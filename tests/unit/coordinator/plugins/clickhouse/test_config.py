@@ -12,10 +12,13 @@ from astacus.coordinator.plugins.zookeeper_config import (
     ZooKeeperNode,
 )
 from collections.abc import Sequence
+from contextlib import AsyncExitStack
 from kazoo.client import KazooClient
 from pydantic import SecretStr
 from typing import cast
+from unittest import mock
 
+import httpx
 import pytest
 
 pytestmark = [pytest.mark.clickhouse]
@@ -49,15 +52,26 @@ def test_default_zookeeper_client_timeout_is_10secs() -> None:
     assert client.timeout == 10
 
 
-def test_get_clickhouse_clients() -> None:
+async def test_get_clickhouse_clients() -> None:
     configuration = ClickHouseConfiguration(
         username="user",
         password="password",
         nodes=[ClickHouseNode(host=f"n{i}.example.org", port=8123 + i) for i in range(3)],
     )
-    clients = cast(Sequence[HttpClickHouseClient], get_clickhouse_clients(configuration))
-    assert [client.host for client in clients] == [node.host for node in configuration.nodes]
-    assert [client.port for client in clients] == [node.port for node in configuration.nodes]
-    for client in clients:
-        assert client.username == configuration.username
-        assert client.password == configuration.password
+    async with AsyncExitStack() as exit_stack:
+        with mock.patch.object(httpx, "AsyncClient", wraps=httpx.AsyncClient) as async_client:
+            clients = cast(
+                Sequence[HttpClickHouseClient],
+                get_clickhouse_clients(configuration, exit_stack=exit_stack, max_concurrent_queries_per_node=4),
+            )
+        async_client.assert_called_once_with(limits=httpx.Limits(max_connections=12, max_keepalive_connections=12))
+        assert [client.host for client in clients] == [node.host for node in configuration.nodes]
+        assert [client.port for client in clients] == [node.port for node in configuration.nodes]
+        for client in clients:
+            assert client.username == configuration.username
+            assert client.password == configuration.password
+        http_client = clients[0].http_client
+        assert http_client is not None
+        assert all(client.http_client is http_client for client in clients)
+        assert not http_client.is_closed
+    assert http_client is not None and http_client.is_closed
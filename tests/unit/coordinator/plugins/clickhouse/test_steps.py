@@ -478,6 +478,11 @@ async def test_move_frozen_parts_steps() -> None:
                         file_size=100,
                         mtime_ns=1,
                     ),
+                    SnapshotFile(
+                        relative_path=f"shadow/astacus/store/{table_uuid_parts}/detached/all_0_0_0/count.txt",
+                        file_size=100,
+                        mtime_ns=1,
+                    ),
                     SnapshotFile(
                         relative_path=f"disks/remote/shadow/astacus/store/{table_uuid_parts}/detached/all_0_0_0/data.bin",
                         file_size=100,
@@ -498,6 +503,11 @@ async def test_move_frozen_parts_steps() -> None:
                 file_size=100,
                 mtime_ns=1,
             ),
+            SnapshotFile(
+                relative_path=f"store/{table_uuid_parts}/all_0_0_0/count.txt",
+                file_size=100,
+                mtime_ns=1,
+            ),
             SnapshotFile(
                 relative_path=f"disks/remote/store/{table_uuid_parts}/all_0_0_0/data.bin",
                 file_size=100,
@@ -568,6 +578,24 @@ async def test_freezes_all_mergetree_tables_listed_in_manifest(all_clients: bool
         assert second_client.mock_calls == []
 
 
+async def test_freezes_tables_concurrently_on_each_node() -> None:
+    context = StepsContext()
+    context.set_result(GetVersionsStep, [(23, 8)])
+    client = mock_clickhouse_client()
+    step = FreezeTablesStep(
+        clients=[client], freeze_name="astacus", freeze_unfreeze_timeout=3600.0, max_concurrent_freeze_unfreeze_per_node=3
+    )
+    cluster = Cluster(nodes=[CoordinatorNode(url="node1")])
+    context.set_result(RetrieveDatabasesAndTablesStep, (SAMPLE_DATABASES, SAMPLE_TABLES))
+    await step.run_step(cluster, context)
+    freeze_queries = [call.args[0] for call in client.execute.mock_calls if call.args[0].startswith(b"ALTER TABLE")]
+    assert sorted(freeze_queries) == [
+        b"ALTER TABLE `db-one`.`table-dos` FREEZE WITH NAME 'astacus' SETTINGS distributed_ddl_task_timeout=3600.0",
+        b"ALTER TABLE `db-one`.`table-uno` FREEZE WITH NAME 'astacus' SETTINGS distributed_ddl_task_timeout=3600.0",
+        b"ALTER TABLE `db-two`.`table-eins` FREEZE WITH NAME 'astacus' SETTINGS distributed_ddl_task_timeout=3600.0",
+    ]
+
+
 def b64_str(b: bytes) -> str:
     return b64encode(b).decode()
 
@@ -897,9 +925,14 @@ async def test_creates_all_access_entities_in_manifest() -> None:
     await check_restored_entities(client)
 
 
-async def test_creating_all_access_entities_can_be_retried() -> None:
+@pytest.mark.parametrize("max_entities_per_transaction", [1, 4, 32])
+async def test_creating_all_access_entities_can_be_retried(max_entities_per_transaction: int) -> None:
     client = FakeZooKeeperClient()
-    step = RestoreAccessEntitiesStep(zookeeper_client=client, access_entities_path="/clickhouse/access")
+    step = RestoreAccessEntitiesStep(
+        zookeeper_client=client,
+        access_entities_path="/clickhouse/access",
+        max_entities_per_transaction=max_entities_per_transaction,
+    )
     context = StepsContext()
     context.set_result(ClickHouseManifestStep, SAMPLE_MANIFEST)
     async with client.connect() as connection:
@@ -14,6 +14,7 @@ from astacus.coordinator.cluster import Cluster
 from astacus.coordinator.config import CoordinatorNode
 from astacus.coordinator.plugins.base import (
     BackupManifestStep,
+    BackupNameStep,
     ComputeKeptBackupsStep,
     DeleteBackupAndDeltaManifestsStep,
     DeleteBackupManifestsStep,
@@ -22,9 +23,11 @@ from astacus.coordinator.plugins.base import (
     ListBackupsStep,
     ListDeltaBackupsStep,
     ListHexdigestsStep,
+    ParallelStep,
     SnapshotReleaseStep,
     SnapshotStep,
     Step,
+    StepFailedError,
     StepsContext,
     UploadBlocksStep,
     UploadManifestStep,
@@ -36,6 +39,7 @@ from io import BytesIO
 from tests.unit.storage import MemoryHexDigestStorage, MemoryJsonStorage
 from unittest import mock
 
+import asyncio
 import dataclasses
 import datetime
 import httpx
@@ -69,6 +73,44 @@ def test_steps_context_result_can_only_be_set_once():
         context.set_result(DummyStep, 10)
 
 
+class OtherDummyStep(Step[str]):
+    async def run_step(self, cluster: Cluster, context: StepsContext) -> str:
+        return "other"
+
+
+async def test_parallel_step_stores_result_of_each_step() -> None:
+    context = StepsContext()
+    step = ParallelStep(steps=[DummyStep(), OtherDummyStep()])
+    await step.run_step(Cluster(nodes=[]), context)
+    assert context.get_result(DummyStep) == 1
+    assert context.get_result(OtherDummyStep) == "other"
+
+
+class FailingDummyStep(Step[None]):
+    async def run_step(self, cluster: Cluster, context: StepsContext) -> None:
+        raise StepFailedError("failed")
+
+
+class SlowDummyStep(Step[None]):
+    cancelled = False
+
+    async def run_step(self, cluster: Cluster, context: StepsContext) -> None:
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+
+
+async def test_parallel_step_cancels_other_steps_on_failure() -> None:
+    context = StepsContext()
+    slow_step = SlowDummyStep()
+    step = ParallelStep(steps=[slow_step, FailingDummyStep()])
+    with pytest.raises(StepFailedError):
+        await step.run_step(Cluster(nodes=[]), context)
+    assert slow_step.cancelled
+
+
 def get_sample_hashes() -> list[ipc.SnapshotHash]:
     data = b"new_data"
     hexdigest = hash_hexdigest_readable(BytesIO(data))
@@ -364,6 +406,28 @@ async def test_delete_dangling_hexdigests_step(
     assert stored_hashes == expected_hashes
 
 
+async def test_backup_name_step_selects_latest_backup(single_node_cluster: Cluster, context: StepsContext) -> None:
+    names = ["backup-2020-01-02", "backup-2020-01-03", "backup-2020-01-01"]
+    async_json_storage = AsyncJsonStorage(storage=MemoryJsonStorage(items={name: b"{}" for name in names}))
+    step = BackupNameStep(json_storage=async_json_storage, requested_name="")
+    assert await step.run_step(single_node_cluster, context) == "backup-2020-01-03"
+
+
+async def test_backup_name_step_fails_without_backups(single_node_cluster: Cluster, context: StepsContext) -> None:
+    step = BackupNameStep(json_storage=AsyncJsonStorage(storage=MemoryJsonStorage(items={})), requested_name="")
+    with pytest.raises(StepFailedError):
+        await step.run_step(single_node_cluster, context)
+
+
+async def test_list_hexdigests_step_reuses_listing_across_attempts(single_node_cluster: Cluster) -> None:
+    hexdigest_storage = MemoryHexDigestStorage(items={"a": b"a"})
+    step = ListHexdigestsStep(hexdigest_storage=AsyncHexDigestStorage(storage=hexdigest_storage))
+    with mock.patch.object(MemoryHexDigestStorage, "list_hexdigests", return_value=["a"]) as list_mock:
+        assert await step.run_step(single_node_cluster, StepsContext(attempt=1)) == {"a"}
+        assert await step.run_step(single_node_cluster, StepsContext(attempt=2)) == {"a"}
+    assert list_mock.call_count == 1
+
+
 async def test_delete_backup_and_delta_manifests_raises_when_delta_steps_are_missing(
     single_node_cluster: Cluster, context: StepsContext
 ) -> None:
@@ -59,6 +59,16 @@ async def test_fake_zookeeper_client_get_missing_node_fails() -> None:
             await connection.get("/path/to_key")
 
 
+async def test_fake_zookeeper_client_get_many() -> None:
+    client = FakeZooKeeperClient()
+    async with client.connect() as connection:
+        await connection.create("/path/to_key", b"content")
+        await connection.create("/path/to_other_key", b"other content")
+        assert await connection.get_many(["/path/to_other_key", "/path/to_key"]) == [b"other content", b"content"]
+        with pytest.raises(NoNodeError):
+            await connection.get_many(["/path/to_key", "/path/to_missing_key"])
+
+
 async def test_fake_zookeeper_client_set_missing_node_fails() -> None:
     client = FakeZooKeeperClient()
     async with client.connect() as connection:
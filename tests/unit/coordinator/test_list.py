@@ -20,15 +20,20 @@ from astacus.common.ipc import (
 from astacus.common.rohmustorage import MultiRohmuStorage
 from astacus.coordinator import api
 from astacus.coordinator.api import get_cache_entries_from_list_response
+from astacus.coordinator.config import CoordinatorConfig
 from astacus.coordinator.list import compute_deduplicated_snapshot_file_stats, list_backups
+from astacus.coordinator.state import CoordinatorState
 from fastapi.testclient import TestClient
 from os import PathLike
 from pytest_mock import MockerFixture
 from tests.utils import create_rohmu_config
 from unittest import mock
 
+import asyncio
 import datetime
+import msgspec
 import pytest
+import time
 
 
 def test_api_list(client: TestClient, populated_mstorage: MultiRohmuStorage, mocker: MockerFixture) -> None:
@@ -102,6 +107,13 @@ def test_api_list(client: TestClient, populated_mstorage: MultiRohmuStorage, moc
     _run()
     assert not m.called
 
+    # Different request must not be served from the cached response
+    m.return_value = ListResponse(storages=[])
+    response = client.request("GET", "/list", json="y")
+    assert response.status_code == 200, response.json()
+    assert response.json() == {"storages": []}
+    assert m.called
+
 
 @pytest.fixture(name="backup_manifest")
 def fixture_backup_manifest() -> BackupManifest:
@@ -310,6 +322,21 @@ def test_get_cache_entries_from_list_response() -> None:
     }
 
 
+async def test_concurrent_list_requests_share_listing(mocker: MockerFixture) -> None:
+    list_response = ListResponse(storages=[ListForStorage(storage_name="x", backups=[create_backup("backup_x_1")])])
+
+    def _slow_list_backups(**kwargs) -> ListResponse:
+        time.sleep(0.1)
+        return list_response
+
+    m = mocker.patch.object(api, "list_backups", side_effect=_slow_list_backups)
+    c = mock.Mock(config=CoordinatorConfig(plugin=Plugin.files), state=CoordinatorState())
+    responses = await asyncio.gather(*(api._list_backups(c=c, request=mock.Mock()) for _ in range(3)))
+    assert m.call_count == 1
+    assert {response.body for response in responses} == {msgspec.json.encode(list_response)}
+    assert c.state.cached_list_refresh_done is None
+
+
 def create_backup(name: str) -> ListSingleBackup:
     return ListSingleBackup(
         name=name,
@@ -20,6 +20,9 @@ def test_status_nonexistent(client: TestClient) -> None:
     assert response.status_code == 404
     assert response.json() == {"detail": {"code": "operation_id_mismatch", "message": "Unknown operation id", "op": 123}}
 
+    response = client.get("/nosuch/123")
+    assert response.status_code == 422
+
 
 def test_lock_no_nodes(app: FastAPI, client: TestClient) -> None:
     nodes = app.state.coordinator_config.nodes
@@ -44,6 +47,7 @@ def test_lock_ok(app: FastAPI, client: TestClient) -> None:
             respx.post(f"{node.url}/lock?locker=z&ttl=60").respond(json={"locked": True})
         response = client.post("/lock?locker=z")
         assert response.status_code == 200, response.json()
+        assert response.json()["unlock_url"] == "http://testserver/unlock?locker=z"
 
         response = client.get(response.json()["status_url"])
         assert response.status_code == 200, response.json()
@@ -38,6 +38,8 @@ def test_download(
             ("foo2", b"foo2"),
             ("foobig", b"foobig" * magic.DEFAULT_EMBEDDED_FILE_SIZE),
             ("foobig2", b"foobig2" * magic.DEFAULT_EMBEDDED_FILE_SIZE),
+            ("sub/dir/foo3", b"foo3"),
+            ("sub/foobig", b"foobig" * magic.DEFAULT_EMBEDDED_FILE_SIZE),
         ],
     )
     snapshot, snapshotter = build_snapshot_and_snapshotter(src, dst, db, SQLiteSnapshot, [SnapshotGroup("**")])
@@ -68,10 +70,39 @@ def test_download(
 
     # Ensure the files are same (modulo mtime_ns, which doesn't
     # guaranteedly hit quite same numbers)
+    assert len(ss1.files) == len(ss2.files)
     for ssfile1, ssfile2 in zip(ss1.files, ss2.files):
         assert ssfile1.equals_excluding_mtime(ssfile2)
 
 
+def test_download_keeps_existing_identical_files(
+    storage: FileStorage, uploader: Uploader, root: Path, src: Path, dst: Path, db: Path
+) -> None:
+    create_files_at_path(src, [("foobig", b"foobig" * magic.DEFAULT_EMBEDDED_FILE_SIZE), ("foo", b"foo")])
+    snapshot, snapshotter = build_snapshot_and_snapshotter(src, dst, db, SQLiteSnapshot, [SnapshotGroup("**")])
+    with snapshotter.lock:
+        snapshotter.perform_snapshot(progress=Progress())
+        ss1 = snapshotter.get_snapshot_state()
+        hashes = list(snapshot.get_all_digests())
+    uploader.write_hashes_to_storage(snapshot=snapshot, hashes=hashes, progress=Progress(), parallel=1)
+
+    dst2 = Path(root / "dst2")
+    dst2.mkdir()
+    dst3 = Path(root / "dst3")
+    dst3.mkdir()
+    create_files_at_path(dst2, [("foobig", b"foobig" * magic.DEFAULT_EMBEDDED_FILE_SIZE), ("foo", b"bar")])
+    existing_inode = (dst2 / "foobig").stat().st_ino
+
+    _, snapshotter = build_snapshot_and_snapshotter(dst2, dst3, Path(root / "db2"), SQLiteSnapshot, [SnapshotGroup("**")])
+    downloader = Downloader(storage=storage, snapshotter=snapshotter, dst=dst2, parallel=1)
+    with snapshotter.lock:
+        downloader.download_from_storage(progress=Progress(), snapshotstate=ss1)
+
+    # The identical file was not downloaded again, the different one was replaced
+    assert (dst2 / "foobig").stat().st_ino == existing_inode
+    assert (dst2 / "foo").read_bytes() == b"foo"
+
+
 def test_api_download(client: TestClient, mocker: MockerFixture) -> None:
     mocker.patch.object(utils, "http_request")
     response = client.post("/node/download")